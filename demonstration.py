@@ -11,6 +11,10 @@ This script demonstrates all features of the TreeOfLife class, including:
 """
 
 import os
+import matplotlib
+# Everything here is saved to files, so use the non-interactive Agg backend
+# instead of initializing a GUI backend
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from tol import TreeOfLife, ColorScheme
 
@@ -1,24 +1,313 @@
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from typing import Tuple, Dict, Optional, NamedTuple, Any, Set
+# NOTE: matplotlib is imported lazily inside the rendering methods, since
+# importing pyplot dominates startup for callers that never render
+from typing import Tuple, Dict, Optional, NamedTuple, Any, Set, FrozenSet, List, Mapping
 import numpy as np
 from pathlib import Path as FilePath
 from enum import Enum
+from collections import OrderedDict
+from functools import lru_cache
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+import io
+import json
+import os
+import pickle
+import struct
+import sys
 
 # Import color-related functionality from color_utils
 from .color_utils import (
     ColorScheme, ColorEffect, ColorParser,
-    DEFAULT_SEPHIROTH_COLORS, DEFAULT_PATH_COLORS,
+    DEFAULT_SEPHIROTH_COLOR_TABLE, DEFAULT_PATH_COLOR_TABLE,
     apply_color_effect, apply_path_effect, blend_colors,
-    get_contrasting_text_color
+    get_contrasting_text_color, hex_to_rgba, colors_to_rgba_array
 )
 
 # Define type aliases for clarity
 Coord = Tuple[float, float]
 PathIndices = Tuple[int, int]
-
-
-class Sephirah(NamedTuple):
+ColorData = Mapping[str, Mapping[str, Mapping[int, Mapping[str, Any]]]]
+# Scheme name -> section ('sephiroth' or 'paths') -> precomputed lookup table
+SchemeTables = Mapping[str, Mapping[str, "_SchemeSection"]]
+
+# Color tables are stored in single precision: colors end up as 8-bit channels,
+# so float32 is exact enough and halves the tables. (Coordinates stay float64,
+# which is what matplotlib's transforms work in.)
+_RGBA_DTYPE = np.float32
+
+# Process-wide LRU cache of parsed color scales and the lookup tables built
+# from them (see _build_scheme_tables), keyed by (path, mtime_ns, size)
+_COLOR_DATA_CACHE: "OrderedDict[Tuple[str, int, int], Tuple[ColorData, SchemeTables]]" = OrderedDict()
+_COLOR_DATA_CACHE_MAX_ENTRIES = 32
+
+# Header of the on-disk sidecar cache: magic, format version, source mtime_ns,
+# source size (28 bytes)
+_SIDECAR_HEADER = struct.Struct("<8sIqq")
+_SIDECAR_MAGIC = b"TOLCOLOR"
+# Bump whenever the shape of ColorParser's output (or the sidecar encoding)
+# changes, so sidecars written by an older version are treated as stale
+_SIDECAR_VERSION = 5
+
+
+def _encode_color_data(color_data: ColorData) -> bytes:
+    """
+    Encode parsed color data as JSON for the sidecar cache.
+
+    The sidecar holds plain data only (never pickle), so a planted or
+    tampered cache file can at worst fail to decode.
+
+    Args:
+        color_data: Parsed color data, as returned by ColorParser
+
+    Returns:
+        UTF-8 JSON of {scheme: {section: {number: [color, effect]}}}, where
+        effect is null or [kind, color2, color2_hex, [[name, hex], ...]]
+    """
+    def encode_effect(effect: Optional[ColorEffect]) -> Optional[list]:
+        if effect is None:
+            return None
+        return [effect.kind, effect.color2, effect.color2_hex,
+                [list(option) for option in effect.colors]]
+
+    encoded = {
+        scheme_name: {
+            section: {
+                str(number): [info['color'], encode_effect(info['effects'])]
+                for number, info in entries.items()
+            }
+            for section, entries in scale.items()
+        }
+        for scheme_name, scale in color_data.items()
+    }
+    return json.dumps(encoded, separators=(',', ':')).encode('utf-8')
+
+
+def _decode_color_data(payload: bytes) -> ColorData:
+    """
+    Rebuild parsed color data (with ColorEffect records) from sidecar JSON.
+
+    Args:
+        payload: Bytes written by _encode_color_data
+
+    Returns:
+        Color data in the same shape ColorParser returns
+    """
+    def decode_effect(effect: Optional[list]) -> Optional[ColorEffect]:
+        if effect is None:
+            return None
+        kind, color2, color2_hex, colors = effect
+        return ColorEffect(
+            kind, color2=color2,
+            color2_hex=sys.intern(color2_hex) if color2_hex is not None else None,
+            colors=tuple((name, sys.intern(hex_value)) for name, hex_value in colors))
+
+    return {
+        scheme_name: {
+            section: {
+                int(number): {'color': sys.intern(color), 'effects': decode_effect(effect)}
+                for number, (color, effect) in entries.items()
+            }
+            for section, entries in scale.items()
+        }
+        for scheme_name, scale in json.loads(payload.decode('utf-8')).items()
+    }
+
+
+def _read_color_sidecar(sidecar_path: str, mtime_ns: int, size: int) -> Optional[ColorData]:
+    """
+    Read parsed color data from a sidecar cache file if it matches the source file.
+
+    Args:
+        sidecar_path: Path to the sidecar cache file
+        mtime_ns: Modification time (ns) of the source YAML file
+        size: Size in bytes of the source YAML file
+
+    Returns:
+        The cached color data, or None if the sidecar is missing, stale or unreadable
+    """
+    try:
+        with open(sidecar_path, 'rb') as f:
+            raw = f.read()
+    except OSError:
+        return None
+
+    if len(raw) < _SIDECAR_HEADER.size:
+        return None
+
+    magic, version, cached_mtime_ns, cached_size = _SIDECAR_HEADER.unpack_from(raw)
+    if (magic != _SIDECAR_MAGIC or version != _SIDECAR_VERSION
+            or cached_mtime_ns != mtime_ns or cached_size != size):
+        return None
+
+    try:
+        return _decode_color_data(raw[_SIDECAR_HEADER.size:])
+    except Exception:
+        # A corrupt (or malformed) sidecar is simply regenerated from the
+        # YAML source
+        return None
+
+
+def _write_color_sidecar(sidecar_path: str, mtime_ns: int, size: int, color_data: ColorData) -> None:
+    """
+    Write parsed color data to a sidecar cache file next to the source YAML.
+
+    Failures (e.g. a read-only install location) are ignored, since the sidecar
+    is only an optimization.
+
+    Args:
+        sidecar_path: Path to the sidecar cache file
+        mtime_ns: Modification time (ns) of the source YAML file
+        size: Size in bytes of the source YAML file
+        color_data: Parsed color data to store
+    """
+    payload = _SIDECAR_HEADER.pack(_SIDECAR_MAGIC, _SIDECAR_VERSION, mtime_ns, size) + \
+        _encode_color_data(color_data)
+    tmp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        # Atomic rename so concurrent readers never see a partial file
+        os.replace(tmp_path, sidecar_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _freeze(obj: Any) -> Any:
+    """
+    Recursively convert dicts to read-only mappings and lists to tuples.
+
+    Args:
+        obj: Parsed YAML value
+
+    Returns:
+        An immutable equivalent of the value
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+
+@lru_cache(maxsize=None)
+def _warn_once(message: str) -> None:
+    """
+    Print a warning, at most once per process for each distinct message.
+
+    Callers that build many trees with the same misconfiguration would
+    otherwise repeat the same warning (and the same console write) every time.
+
+    Args:
+        message: The warning text, without the "Warning: " prefix
+    """
+    print(f"Warning: {message}")
+
+
+@dataclass(slots=True, frozen=True)
+class _SchemeSection:
+    """Colors of one section (Sephiroth or Paths) of a color scheme, as parallel tables."""
+    # Hex color by index (None where the scheme has no entry)
+    colors: Tuple[Optional[str], ...]
+    # Special color effect by index
+    effects: Tuple[Optional[ColorEffect], ...]
+    # Read-only (N, 4) RGBA table of the colors (white where there is no entry)
+    rgba: np.ndarray
+
+
+def _build_scheme_tables(color_data: ColorData) -> SchemeTables:
+    """
+    Precompute per-scheme lookup tables from parsed color data.
+
+    Sephiroth are indexed by number (index 0 is Da'ath) and paths by number - 11.
+    Every color is parsed to RGBA once here, so applying a scheme neither walks
+    the nested color data nor parses hex strings.
+
+    Args:
+        color_data: Parsed (frozen) color data
+
+    Returns:
+        Read-only tables by scheme name and section
+    """
+    tables = {}
+    for scheme_name, scale in color_data.items():
+        sections = {}
+        for section, numbers in (('sephiroth', range(11)), ('paths', range(11, 33))):
+            entries = scale.get(section, {})
+            data = [entries.get(number) for number in numbers]
+            colors = tuple(entry['color'] if entry else None for entry in data)
+            rgba = colors_to_rgba_array(
+                [color or "#FFFFFF" for color in colors], dtype=_RGBA_DTYPE)
+            rgba.flags.writeable = False
+            sections[section] = _SchemeSection(
+                colors=colors,
+                effects=tuple(entry['effects'] if entry else None for entry in data),
+                rgba=rgba)
+        tables[scheme_name] = MappingProxyType(sections)
+    return MappingProxyType(tables)
+
+
+@lru_cache(maxsize=32)
+def _resolve_color_scales_path(file_path: str) -> str:
+    """
+    Resolve a color scales path to its canonical form (memoized).
+
+    Resolving symlinks means different paths to the same file share one
+    cache entry and one sidecar.
+
+    Args:
+        file_path: Path to the color_scales.yaml file, as given by the caller
+
+    Returns:
+        The absolute path with all symlinks resolved
+    """
+    return os.path.realpath(file_path)
+
+
+def _load_color_scales_cached(file_path: str, st: os.stat_result) -> Tuple[ColorData, SchemeTables]:
+    """
+    Load parsed color scales, reusing earlier parses whenever possible.
+
+    Lookups go through a process-wide LRU cache first, then a JSON sidecar file
+    (``<file_path>.cache``), and only fall back to parsing the YAML when both are
+    missing or stale. Entries are validated against the file's mtime and size.
+
+    Args:
+        file_path: Resolved path to the color_scales.yaml file
+        st: Result of ``os.stat`` on the file, used to validate cache entries
+
+    Returns:
+        Tuple of (color data, scheme lookup tables), both frozen (read-only)
+        since they are shared by every instance loading the same file
+    """
+    key = (file_path, st.st_mtime_ns, st.st_size)
+
+    cached = _COLOR_DATA_CACHE.get(key)
+    if cached is not None:
+        _COLOR_DATA_CACHE.move_to_end(key)
+        return cached
+
+    sidecar_path = f"{file_path}.cache"
+    color_data = _read_color_sidecar(sidecar_path, st.st_mtime_ns, st.st_size)
+    if color_data is None:
+        color_data = ColorParser.parse_color_scales(file_path)
+        # Only persist successful parses; errors yield an empty dict
+        if color_data:
+            _write_color_sidecar(sidecar_path, st.st_mtime_ns, st.st_size, color_data)
+
+    color_data = _freeze(color_data)
+    cached = (color_data, _build_scheme_tables(color_data))
+    _COLOR_DATA_CACHE[key] = cached
+    if len(_COLOR_DATA_CACHE) > _COLOR_DATA_CACHE_MAX_ENTRIES:
+        _COLOR_DATA_CACHE.popitem(last=False)
+
+    return cached
+
+
+@dataclass(slots=True, frozen=True)
+class Sephirah:
     """Data structure to store information about a Sephirah."""
     number: int  # Sephirah number (1-10)
     name: str  # Name of the Sephirah (e.g., "Kether", "Chokmah", etc.)
@@ -28,8 +317,24 @@ class Sephirah(NamedTuple):
     # Special color effect (flecked, rayed, tinged)
     color_effect: Optional[ColorEffect] = None
 
+    def with_color(self, color: str, color_effect: Optional[ColorEffect]) -> 'Sephirah':
+        """
+        Get this Sephirah with the given styling, reusing it if nothing changes.
+
+        Args:
+            color: The new color
+            color_effect: The new special color effect, or None
+
+        Returns:
+            This Sephirah when the styling is unchanged, otherwise an updated copy
+        """
+        if color == self.color and color_effect is self.color_effect:
+            return self
+        return replace(self, color=color, color_effect=color_effect)
+
 
-class Path(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class Path:
     """Data structure to store information about a connecting path."""
     number: int  # Path number (11-32)
     # Tuple of the two Sephiroth indices it connects (0-based)
@@ -39,6 +344,297 @@ class Path(NamedTuple):
     # Special color effect (flecked, rayed, tinged)
     color_effect: Optional[ColorEffect] = None
 
+    def with_color(self, color: str, color_effect: Optional[ColorEffect]) -> 'Path':
+        """
+        Get this path with the given styling, reusing it if nothing changes.
+
+        Args:
+            color: The new color
+            color_effect: The new special color effect, or None
+
+        Returns:
+            This path when the styling is unchanged, otherwise an updated copy
+        """
+        if color == self.color and color_effect is self.color_effect:
+            return self
+        return replace(self, color=color, color_effect=color_effect)
+
+
+# Names of the Sephiroth, indexed by number (0 is Da'ath)
+_SEPHIROTH_NAMES: Tuple[str, ...] = (
+    "Da'ath", "Kether", "Chokmah", "Binah", "Chesed", "Geburah",
+    "Tiphereth", "Netzach", "Hod", "Yesod", "Malkuth")
+
+# Unit (x, y) layout of the Sephiroth, row i holding Sephirah i+1, before
+# scaling by the spacing factor (Da'ath is derived from it, see _init_daath)
+_BASE_SEPH_XY = np.array([
+    [0.0, 9.0],    # Kether
+    [2.0, 8.0],    # Chokmah
+    [-2.0, 8.0],   # Binah
+    [2.0, 5.5],    # Chesed
+    [-2.0, 5.5],   # Geburah
+    [0.0, 4.25],   # Tiphereth
+    [2.0, 3.0],    # Netzach
+    [-2.0, 3.0],   # Hod
+    [0.0, 1.75],   # Yesod
+    [0.0, -0.7],   # Malkuth
+], dtype=np.float64)
+_BASE_SEPH_XY.flags.writeable = False
+
+# Rows of _BASE_SEPH_XY that get the vertical shift (all but Kether)
+_SHIFT_ROWS = slice(1, None)
+
+# The paths connecting the Sephiroth, fixed by tradition: each entry maps a
+# path number (11-32) to the 1-based numbers of the Sephiroth it connects
+_PATH_CONNECTIONS: Tuple[Tuple[int, Tuple[int, int]], ...] = (
+    # Path number, (from_sephirah, to_sephirah)
+    (11, (1, 2)),  # Kether to Chokmah
+    (12, (1, 3)),  # Kether to Binah
+    (13, (1, 6)),  # Kether to Tiphereth
+    (14, (2, 3)),  # Chokmah to Binah
+    (15, (2, 6)),  # Chokmah to Tiphereth
+    (16, (2, 4)),  # Chokmah to Chesed
+    (17, (3, 6)),  # Binah to Tiphereth
+    (18, (3, 5)),  # Binah to Geburah
+    (19, (4, 5)),  # Chesed to Geburah
+    (20, (4, 6)),  # Chesed to Tiphereth
+    (21, (4, 7)),  # Chesed to Netzach
+    (22, (5, 6)),  # Geburah to Tiphereth
+    (23, (5, 8)),  # Geburah to Hod
+    (24, (6, 7)),  # Tiphereth to Netzach
+    (25, (6, 9)),  # Tiphereth to Yesod
+    (26, (6, 8)),  # Tiphereth to Hod
+    (27, (7, 8)),  # Netzach to Hod
+    (28, (7, 9)),  # Netzach to Yesod
+    (29, (7, 10)),  # Netzach to Malkuth
+    (30, (8, 9)),  # Hod to Yesod
+    (31, (8, 10)),  # Hod to Malkuth
+    (32, (9, 10)),  # Yesod to Malkuth
+)
+
+# Path numbers in row order, and the (22, 2) 0-based Sephirah indices each
+# path connects (read-only: shared by every instance)
+_PATH_NUMS = np.array([number for number, _ in _PATH_CONNECTIONS])
+_PATH_NUMS.flags.writeable = False
+_PATH_IDX = np.array([(from_sephirah - 1, to_sephirah - 1)
+                      for _, (from_sephirah, to_sephirah) in _PATH_CONNECTIONS], dtype=np.intp)
+_PATH_IDX.flags.writeable = False
+
+# (10, 22) mask: _PATH_TOUCHES[s, row] is True iff the path in that row
+# touches Sephirah s + 1
+_PATH_TOUCHES = np.zeros((10, len(_PATH_CONNECTIONS)), dtype=bool)
+_PATH_TOUCHES[_PATH_IDX[:, 0], np.arange(len(_PATH_CONNECTIONS))] = True
+_PATH_TOUCHES[_PATH_IDX[:, 1], np.arange(len(_PATH_CONNECTIONS))] = True
+_PATH_TOUCHES.flags.writeable = False
+
+# Astrological and elemental symbols for each path (ordered by path number 11-32)
+_PATH_SYMBOLS: Mapping[int, str] = MappingProxyType({
+    11: '△̵',  # Air - Kether to Chokmah
+    12: '☿',   # Mercury - Kether to Binah
+    13: '☽',   # Moon - Kether to Tiphereth
+    14: '♀',   # Venus - Chokmah to Binah
+    15: '♒',   # Aquarius - Chokmah to Tiphereth
+    16: '♉',   # Taurus - Chokmah to Chesed
+    17: '♊',   # Gemini - Binah to Tiphereth
+    18: '♋',   # Cancer - Binah to Geburah
+    19: '♌',   # Leo - Chesed to Geburah
+    20: '♍',   # Virgo - Chesed to Tiphereth
+    21: '♃',   # Jupiter - Chesed to Netzach
+    22: '♎',   # Libra - Geburah to Tiphereth
+    23: '▽',   # Water - Geburah to Hod
+    24: '♏',   # Scorpio - Tiphereth to Netzach
+    25: '♐',   # Sagittarius - Tiphereth to Yesod
+    26: '♑',   # Capricorn - Tiphereth to Hod
+    27: '♂',   # Mars - Netzach to Hod
+    28: '♈',   # Aries - Netzach to Yesod
+    29: '♓',   # Pisces - Netzach to Malkuth
+    30: '☉',   # Sun - Hod to Yesod
+    31: '△ ⊙',  # Fire & Spirit - Hod to Malkuth
+    32: '♄\n▽̵'  # Saturn & Earth - Yesod to Malkuth
+})
+
+# Paths whose labels need an orientation fix (they would render upside down)
+_PATHS_NEEDING_FLIP: FrozenSet[int] = frozenset({12, 15, 20, 26, 28, 29})
+
+# Extra vertical label offsets (in units of spacing_factor) for paths whose
+# labels need custom positioning: path 13 (Kether to Tiphereth) needs to be
+# higher, and path 25 (Tiphereth to Yesod) needs to be raised a bit
+_SPECIAL_OFFSETS_Y: Mapping[int, float] = MappingProxyType({13: 1.6, 25: 0.38})
+
+# Text properties shared by all path labels (clip_on=False as ax.text does)
+_PATH_LABEL_TEXT_KW: Mapping[str, Any] = MappingProxyType({
+    'horizontalalignment': 'center',
+    'verticalalignment': 'center',
+    'rotation_mode': 'anchor',
+    'clip_on': False,
+})
+
+# Paths that need different z-ordering: these are drawn underneath the others
+# (13: Kether to Tiphereth, 15: Chokmah to Tiphereth, 17: Binah to Tiphereth,
+# 25: Tiphereth to Yesod) ...
+_PATHS_UNDERNEATH: FrozenSet[int] = frozenset({13, 15, 17, 25})
+# ... and the horizontal paths (14: Chokmah to Binah, 19: Chesed to Geburah,
+# 27: Netzach to Hod) are drawn last within the normal layer
+_PATHS_HORIZONTAL: FrozenSet[int] = frozenset({14, 19, 27})
+
+# Z-order offsets of the path groups, in drawing order (normal, underneath, horizontal)
+_PATH_GROUP_ZORDER_OFFSETS: Tuple[int, ...] = (0, -1, 0)
+
+
+@lru_cache(maxsize=1)
+def _plain_sephiroth_rgba() -> np.ndarray:
+    """
+    Get the RGBA table of the plain scheme's Sephiroth colors.
+
+    Returns:
+        A read-only (11, 4) array indexed by Sephirah number (row 0 is Da'ath)
+    """
+    rgba = colors_to_rgba_array(DEFAULT_SEPHIROTH_COLOR_TABLE, dtype=_RGBA_DTYPE)
+    rgba.flags.writeable = False
+    return rgba
+
+
+@lru_cache(maxsize=1)
+def _plain_path_rgba(path_numbers: Tuple[int, ...]) -> np.ndarray:
+    """
+    Get the RGBA table of the plain scheme's path colors.
+
+    Args:
+        path_numbers: Path numbers in row order
+
+    Returns:
+        A read-only (22, 4) array with one row per path
+    """
+    rgba = colors_to_rgba_array(
+        [DEFAULT_PATH_COLOR_TABLE[number - 11] for number in path_numbers], dtype=_RGBA_DTYPE)
+    rgba.flags.writeable = False
+    return rgba
+
+
+def _path_geometry_numpy(seph_xy: np.ndarray, path_idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the midpoint and angle of every path with vectorized NumPy.
+
+    Args:
+        seph_xy: (10, 2) coordinates of the Sephiroth
+        path_idx: (N, 2) 0-based Sephirah indices each path connects
+
+    Returns:
+        Tuple of (N, 2) midpoints and (N,) angles in degrees
+    """
+    start = seph_xy[path_idx[:, 0]]
+    end = seph_xy[path_idx[:, 1]]
+    delta = end - start
+    return (start + end) * 0.5, np.degrees(np.arctan2(delta[:, 1], delta[:, 0]))
+
+
+# Layers render can rasterize in vector output (see render's rasterize_layers)
+_RASTERIZABLE_LAYERS: FrozenSet[str] = frozenset({'glow', 'paths'})
+
+# File extensions matplotlib saves as vector graphics
+_VECTOR_FORMATS: FrozenSet[str] = frozenset({'.svg', '.svgz', '.pdf', '.eps', '.ps'})
+
+# Maximum number of encoded raster files render keeps per instance (see
+# TreeOfLife._saved_outputs)
+_SAVED_OUTPUTS_MAX_ENTRIES = 16
+
+
+def _is_vector_format(file_path: Optional[str]) -> bool:
+    """
+    Check whether a diagram is being saved to a vector graphics format.
+
+    Args:
+        file_path: Output filename, or None when not saving
+
+    Returns:
+        True if the file extension is a vector format
+    """
+    return bool(file_path) and os.path.splitext(str(file_path))[1].lower() in _VECTOR_FORMATS
+
+
+@lru_cache(maxsize=1)
+def _save_pool() -> Any:
+    """
+    Get the process-wide worker pool for background saves, creating it on first use.
+
+    Returns:
+        A ThreadPoolExecutor with two workers
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="tol-save")
+
+
+def _save_figure(fig: Any, save_to_file: str, dpi: int) -> None:
+    """
+    Save a figure to a file (the work done by a background save).
+
+    Args:
+        fig: The figure to save, owned by this save from now on
+        save_to_file: Filename to save to
+        dpi: Resolution in dots per inch
+    """
+    fig.savefig(save_to_file, dpi=dpi, bbox_inches='tight')
+    print(f"Diagram saved to {save_to_file}")
+
+
+@lru_cache(maxsize=1)
+def _kether_glow_image(size: int = 256) -> np.ndarray:
+    """
+    Build the RGBA image of Kether's radiant glow.
+
+    The glow is a stack of concentric white rings, each with decreasing alpha
+    and increasing size as we move outward (alpha 0.5 at 1.0r down to 0.025 at
+    2.8r). Compositing them analytically gives a stepped radial alpha falloff,
+    so the whole glow is drawn as one image instead of one patch per ring.
+
+    Args:
+        size: Width and height of the image in pixels
+
+    Returns:
+        A read-only (size, size, 4) float32 array spanning 3 radii each way
+    """
+    # Distance from the center of every pixel, in units of the 3r half-extent
+    coords = (np.arange(size) + 0.5) / size * 2.0 - 1.0
+    dist = np.hypot(coords[None, :], coords[:, None])
+
+    # Composite the rings: a pixel is covered by every ring at least as large
+    # as its distance, and white over white keeps the color white
+    transparency = np.ones((size, size))
+    for i in range(20, 0, -2):
+        alpha = i / 40.0  # 0.5 to 0.025
+        radius = (1 + (20 - i) / 10.0) / 3.0  # 1.0r to 2.8r, relative to 3r
+        transparency[dist <= radius] *= 1.0 - alpha
+
+    image = np.ones((size, size, 4), dtype=np.float32)
+    image[..., 3] = 1.0 - transparency
+    image.flags.writeable = False
+    return image
+
+
+class _RenderPlan(NamedTuple):
+    """
+    Everything render needs that depends only on the focus and the active color
+    schemes: which elements to draw, with which colors, and the plot limits.
+    """
+    limits: Tuple[float, float, float, float]  # (min_x, max_x, min_y, max_y)
+    # Path numbers to draw and their inner stroke colors, one entry per path
+    # group in the order of _PATH_GROUP_ZORDER_OFFSETS
+    path_groups: Tuple[Tuple[int, ...], ...]
+    path_rows: Tuple[np.ndarray, ...]  # Rows of the same paths (see _path_row)
+    path_inner_colors: Tuple[np.ndarray, ...]  # (N, 4) RGBA arrays
+    path_effects: FrozenSet[int]  # Paths whose color effect is drawn
+    # Sephiroth numbers to draw with their circle/text styling
+    sephiroth: Tuple[int, ...]
+    seph_face_colors: np.ndarray  # (N, 4) RGBA array
+    seph_edge_colors: Tuple[str, ...]
+    seph_alphas: Tuple[float, ...]
+    seph_text_colors: Tuple[str, ...]
+    seph_effects: FrozenSet[int]  # Sephiroth whose color effect is drawn
+    # Da'ath styling as (face color, base color, border color, text color),
+    # or None if Da'ath is not drawn
+    daath_style: Optional[Tuple[Any, str, str, str]]
+    daath_effect: bool  # Whether Da'ath's color effect is drawn
+
 
 class TreeOfLife:
     """Class to create, manipulate and render the Kabbalistic Tree of Life diagram."""
@@ -67,25 +663,69 @@ class TreeOfLife:
         self.base_radius = 0.5
         self.circle_radius = self.base_radius * self.sphere_scale_factor
         self.vertical_shift = -0.5 * self.spacing_factor
+        # Kether glow rings in drawing order: diameters from 2r up to 5.6r,
+        # and alphas from 0.5 down to 0.025
+        glow_steps = np.arange(20, 0, -2)
+        self._glow_diameters = 2 * self.circle_radius * (1 + (20 - glow_steps) / 10.0)
+        self._glow_alphas = glow_steps / 40.0
 
         # Initialize color schemes
         self.sephiroth_color_scheme = sephiroth_color_scheme
         self.path_color_scheme = path_color_scheme
 
-        # Initialize collections to store Sephiroth and Path data
-        # Maps sephirah number (1-10) to its data
-        self.sephiroth: Dict[int, Sephirah] = {}
+        # The color schemes the current Sephiroth and Paths were built with
+        # (None when unknown, e.g. after the dicts were replaced directly)
+        self._seph_scheme_applied: Optional[ColorScheme] = None
+        self._path_scheme_applied: Optional[ColorScheme] = None
+
+        # Initialize collections to store Sephiroth and Path data (see the
+        # sephiroth and paths properties)
+        # Maps sephirah number (1-10, and 0 for Da'ath) to its data
+        self._assign_sephiroth({})
         # Maps path number (11-32) to its data
-        self.paths: Dict[int, Path] = {}
+        self._assign_paths({})
+
+        # Pre-parsed RGBA colors of the current scheme, so rendering never
+        # parses hex strings: an (11, 4) array indexed by Sephirah number
+        # (row 0 is Da'ath), and a (22, 4) array in path row order (see _path_row)
+        self._seph_rgba: np.ndarray = np.zeros((11, 4), dtype=_RGBA_DTYPE)
+        self._path_rgba: np.ndarray = np.zeros((22, 4), dtype=_RGBA_DTYPE)
+
+        # Memo tables of already-built Sephiroth/Path dicts per color scheme, so
+        # switching back to a scheme is a pointer swap instead of a rebuild
+        self._seph_scheme_cache: Dict[ColorScheme,
+                                      Tuple[Dict[int, Sephirah], np.ndarray]] = {}
+        self._path_scheme_cache: Dict[ColorScheme,
+                                      Tuple[Dict[int, Path], np.ndarray]] = {}
+
+        # Render plans by (focus, sephiroth scheme, path scheme); see _get_render_plan
+        self._render_plans: Dict[Tuple[Optional[int], ColorScheme, ColorScheme],
+                                 _RenderPlan] = {}
+
+        # (scene key, figure) of the last headless render, reused by render
+        # when asked to draw the same scene again
+        self._retained_scene: Optional[Tuple[Tuple, Any]] = None
 
-        # Initialize special case for Da'ath (the hidden Sephirah)
-        self.daath = None
+        # LRU of encoded raster files by (scene key, dpi, extension), so saving
+        # a scene that was already saved just writes the bytes again
+        self._saved_outputs: "OrderedDict[Tuple, bytes]" = OrderedDict()
+
+        # Saves still running on the background pool; see flush_saves
+        self._pending_saves: List[Any] = []
+
+        # Shared bold FontProperties for the Sephiroth and path labels, by
+        # font size, built on first use; see _bold_font
+        self._bold_fonts: Dict[float, Any] = {}
+
+        # Pickled blank figures by (figsize, limits); see _new_figure
+        self._figure_templates: Dict[Tuple[Tuple[float, float],
+                                           Tuple[float, float, float, float]], bytes] = {}
 
         # Get absolute path for the color scales file
         module_dir = FilePath(__file__).parent
         self.color_scales_file = str(module_dir / color_scales_file)
 
-        # Parse the color scales file
+        # Parse the color scales file (read-only: shared across instances)
         self.color_data = self._load_color_data()
 
         # Initialize the Sephiroth and Paths
@@ -93,6 +733,12 @@ class TreeOfLife:
         self._init_paths()
         self._init_daath()
 
+        # Everything was just built with the plain scheme's default colors,
+        # so applying that scheme below is a no-op
+        self._seph_rgba = _plain_sephiroth_rgba()
+        self._path_rgba = _plain_path_rgba(tuple(self._path_row))
+        self._seph_scheme_applied = self._path_scheme_applied = ColorScheme.PLAIN
+
         # Apply the initial color schemes
         self.set_sephiroth_color_scheme(sephiroth_color_scheme)
         self.set_path_color_scheme(path_color_scheme)
@@ -186,101 +832,307 @@ class TreeOfLife:
         """
         self.sephiroth_text_mode = mode
 
-    def _load_color_data(self) -> Dict[str, Dict[str, Dict[int, Dict[str, Any]]]]:
-        """Load color data from the color scales file."""
-        if FilePath(self.color_scales_file).exists():
-            return ColorParser.parse_color_scales(self.color_scales_file)
-        else:
-            print(
-                f"Warning: Color scales file '{self.color_scales_file}' not found. Using default colors.")
+    def _load_color_data(self) -> ColorData:
+        """Load color data from the color scales file (cached across instances, read-only)."""
+        # Any scheme dicts built from previously loaded color data are now stale
+        self._seph_scheme_cache.clear()
+        self._path_scheme_cache.clear()
+        self._drop_render_caches()
+        return self._resolve_color_data()
+
+    def _resolve_color_data(self) -> ColorData:
+        """
+        Look up the parsed color scales file and its scheme tables in the shared caches.
+
+        Sets self._scheme_tables as a side effect.
+
+        Returns:
+            The parsed color data, or an empty dict if the file does not exist
+        """
+        # Lookup tables of the loaded schemes (none until loaded)
+        self._scheme_tables: SchemeTables = MappingProxyType({})
+
+        # A single stat both checks existence and validates the caches
+        file_path = _resolve_color_scales_path(str(self.color_scales_file))
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            _warn_once(
+                f"Color scales file '{self.color_scales_file}' not found. Using default colors.")
             return {}
 
+        color_data, self._scheme_tables = _load_color_scales_cached(file_path, st)
+        return color_data
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the state to pickle (or deep-copy) the tree with.
+
+        The color data and scheme tables are read-only objects shared across
+        instances, so they are left out and looked up again on restore, as
+        are the retained figure, the saved-file bytes and pending saves.
+
+        Returns:
+            The instance dict without the shared and transient attributes
+        """
+        state = self.__dict__.copy()
+        for name in ('color_data', '_scheme_tables', '_retained_scene',
+                     '_saved_outputs', '_pending_saves'):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore a pickled (or deep-copied) tree.
+
+        Args:
+            state: State returned by __getstate__
+        """
+        self.__dict__.update(state)
+        self._retained_scene = None
+        self._saved_outputs = OrderedDict()
+        self._pending_saves = []
+        self.color_data = self._resolve_color_data()
+
     def _init_sephiroth(self) -> None:
         """Initialize the positions and properties of the Sephiroth."""
-        # Define the coordinates for the Sephiroth with adjusted spacing
-        sephiroth_data = [
-            # number, name, (x, y) coordinates
-            (1, "Kether", (0 * self.spacing_factor, 9 * self.spacing_factor)),
-            (2, "Chokmah", (2.0 * self.spacing_factor, 8.0 *
-             self.spacing_factor + self.vertical_shift)),
-            (3, "Binah", (-2.0 * self.spacing_factor, 8.0 *
-             self.spacing_factor + self.vertical_shift)),
-            (4, "Chesed", (2.0 * self.spacing_factor, 5.5 *
-             self.spacing_factor + self.vertical_shift)),
-            (5, "Geburah", (-2.0 * self.spacing_factor, 5.5 *
-             self.spacing_factor + self.vertical_shift)),
-            (6, "Tiphereth", (0 * self.spacing_factor, 4.25 *
-             self.spacing_factor + self.vertical_shift)),
-            (7, "Netzach", (2.0 * self.spacing_factor, 3.0 *
-             self.spacing_factor + self.vertical_shift)),
-            (8, "Hod", (-2.0 * self.spacing_factor, 3.0 *
-             self.spacing_factor + self.vertical_shift)),
-            (9, "Yesod", (0 * self.spacing_factor, 1.75 *
-             self.spacing_factor + self.vertical_shift)),
-            (10, "Malkuth", (0 * self.spacing_factor, -
-             0.7 * self.spacing_factor + self.vertical_shift))
-        ]
-
-        # Create Sephirah objects and store them in the dictionary
-        for number, name, coord in sephiroth_data:
-            self.sephiroth[number] = Sephirah(
+        # Scale the unit layout and shift everything but Kether down, in one
+        # vectorized expression. This structure-of-arrays copy of the
+        # coordinates holds Sephirah i+1 in row i.
+        self._seph_xy = _BASE_SEPH_XY * self.spacing_factor
+        self._seph_xy[_SHIFT_ROWS, 1] += self.vertical_shift
+
+        # Create Sephirah objects and store them in the dictionary, taking
+        # each coordinate from one conversion of the whole array
+        coords = self._seph_xy.tolist()
+        self._assign_sephiroth({
+            number: Sephirah(
                 number=number,
-                name=name,
-                coord=coord,
-                color=DEFAULT_SEPHIROTH_COLORS[number]
+                name=_SEPHIROTH_NAMES[number],
+                coord=tuple(coords[number - 1]),
+                color=DEFAULT_SEPHIROTH_COLOR_TABLE[number]
             )
+            for number in range(1, 11)
+        })
 
     def _init_paths(self) -> None:
         """Initialize the paths connecting the Sephiroth."""
-        # Define the paths connecting the Sephiroth
-        # Each entry maps a 1-based path number (11-32) to a tuple of 1-based Sephiroth numbers
-        path_connections = [
-            # Path number, (from_sephirah, to_sephirah)
-            (11, (1, 2)),  # Kether to Chokmah
-            (12, (1, 3)),  # Kether to Binah
-            (13, (1, 6)),  # Kether to Tiphereth
-            (14, (2, 3)),  # Chokmah to Binah
-            (15, (2, 6)),  # Chokmah to Tiphereth
-            (16, (2, 4)),  # Chokmah to Chesed
-            (17, (3, 6)),  # Binah to Tiphereth
-            (18, (3, 5)),  # Binah to Geburah
-            (19, (4, 5)),  # Chesed to Geburah
-            (20, (4, 6)),  # Chesed to Tiphereth
-            (21, (4, 7)),  # Chesed to Netzach
-            (22, (5, 6)),  # Geburah to Tiphereth
-            (23, (5, 8)),  # Geburah to Hod
-            (24, (6, 7)),  # Tiphereth to Netzach
-            (25, (6, 9)),  # Tiphereth to Yesod
-            (26, (6, 8)),  # Tiphereth to Hod
-            (27, (7, 8)),  # Netzach to Hod
-            (28, (7, 9)),  # Netzach to Yesod
-            (29, (7, 10)),  # Netzach to Malkuth
-            (30, (8, 9)),  # Hod to Yesod
-            (31, (8, 10)),  # Hod to Malkuth
-            (32, (9, 10))   # Yesod to Malkuth
-        ]
-
-        # Create Path objects and store them in the dictionary
-        for number, (from_sephirah, to_sephirah) in path_connections:
-            # Convert from 1-based to 0-based indices for internal path representation
-            connects = (from_sephirah - 1, to_sephirah - 1)
-            self.paths[number] = Path(
+        # Create Path objects and store them in the dictionary (connects holds
+        # the 0-based indices used for the internal path representation)
+        self._assign_paths({
+            number: Path(
                 number=number,
                 connects=connects,
-                color=DEFAULT_PATH_COLORS[number]
+                color=DEFAULT_PATH_COLOR_TABLE[number - 11]
             )
+            for number, connects in zip(_PATH_NUMS.tolist(), map(tuple, _PATH_IDX.tolist()))
+        })
+
+        # Precompute the (x1, y1, x2, y2) endpoints of every path as one array,
+        # plus a path number -> row index, so rendering slices instead of looking up
+        self._path_row: Dict[int, int] = {
+            number: row for row, (number, _) in enumerate(_PATH_CONNECTIONS)}
+        # Path numbers in row order (the inverse of _path_row), the Sephirah
+        # indices each path connects, and the touch mask (all shared constants)
+        self._path_nums = _PATH_NUMS
+        self._path_idx = _PATH_IDX
+        self._path_touches = _PATH_TOUCHES
+        # A single gather: (22, 2, 2) endpoint coordinates flattened to (22, 4)
+        self._path_endpoints = self._seph_xy[self._path_idx].reshape(-1, 4)
+
+        # Z-layer group of each path, as an index into _PATH_GROUP_ZORDER_OFFSETS
+        # (0: normal, 1: underneath, 2: horizontal)
+        self._path_category: Dict[int, int] = {
+            number: 1 if number in _PATHS_UNDERNEATH else 2 if number in _PATHS_HORIZONTAL else 0
+            for number, _ in _PATH_CONNECTIONS}
+
+        # Precompute the (static) adjacency once, so focus lookups are O(1):
+        # sephirah number -> numbers of the paths touching it, and
+        # sephirah number -> numbers of the Sephiroth one path away
+        paths_by_seph: Dict[int, List[int]] = {n: [] for n in range(1, 11)}
+        neighbors: Dict[int, List[int]] = {n: [] for n in range(1, 11)}
+        for number, (from_sephirah, to_sephirah) in _PATH_CONNECTIONS:
+            paths_by_seph[from_sephirah].append(number)
+            paths_by_seph[to_sephirah].append(number)
+            neighbors[from_sephirah].append(to_sephirah)
+            neighbors[to_sephirah].append(from_sephirah)
+
+        # For simplicity, consider Da'ath (0) connected to Sephiroth 1-6
+        for number in range(1, 7):
+            neighbors[number].append(0)
+
+        self._paths_by_seph: Dict[int, FrozenSet[int]] = {
+            n: frozenset(nums) for n, nums in paths_by_seph.items()}
+        self._neighbors: Dict[int, FrozenSet[int]] = {
+            n: frozenset(nums) for n, nums in neighbors.items()}
+
+        # Compute the label geometry of all paths in one vectorized pass
+        self._init_path_label_geometry(self._path_nums)
+
+    def _init_path_label_geometry(self, path_nums: np.ndarray) -> None:
+        """
+        Precompute midpoints and label rotations for all paths at once.
+
+        The geometry only changes when the Sephiroth are reassigned, so this
+        replaces the per-path, per-render trigonometry of the label code with
+        array lookups.
+
+        Args:
+            path_nums: Path numbers in row order of self._path_endpoints
+        """
+        # Midpoints of all paths, and the angle of each path for text rotation
+        self._path_mid, angle_deg = _path_geometry_numpy(self._seph_xy, self._path_idx)
+
+        # Adjust angles for readability - text should be right-side up
+        angle_deg = np.where((angle_deg > 90) & (angle_deg < 270),
+                             angle_deg - 180, angle_deg)
+
+        # Force flip for specific paths that are rendering upside down
+        angle_deg = np.where(np.isin(path_nums, list(_PATHS_NEEDING_FLIP)),
+                             angle_deg + 180, angle_deg)
+        self._path_angle_deg = angle_deg
+
+        # Determine which paths are (within 5 degrees of) vertical or horizontal
+        abs_angle = np.abs(angle_deg)
+        self._path_is_vertical = np.abs(abs_angle - 90) < 5
+        is_horizontal = (abs_angle < 5) | (np.abs(abs_angle - 180) < 5)
+
+        # Keep text horizontal for vertical and horizontal paths, otherwise
+        # rotate it to match the path angle
+        self._path_rotation = np.where(
+            self._path_is_vertical | is_horizontal, 0.0, angle_deg)
+
+        # Label anchor of each path: the midpoint, plus a special vertical
+        # offset for paths that need custom positioning
+        offsets_y = np.array([_SPECIAL_OFFSETS_Y.get(number, 0.0) for number in path_nums])
+        self._path_label_xy = self._path_mid + np.column_stack(
+            (np.zeros_like(offsets_y), offsets_y * self.spacing_factor))
+
+        # Label text of each path in row order: the path number combined with
+        # its symbol. For path 32 and vertical paths the number and symbol are
+        # stacked; for horizontal and diagonal paths they sit side by side
+        self._path_labels: Tuple[str, ...] = tuple(
+            ("\n" if number == 32 or is_vertical else " ").join(
+                (str(number), _PATH_SYMBOLS[number]))
+            for number, is_vertical in zip(path_nums.tolist(), self._path_is_vertical.tolist()))
 
     def _init_daath(self) -> None:
         """Initialize the hidden Sephirah Da'ath."""
-        # Da'ath is positioned at the geometric center of Chokmah, Binah, Chesed, and Geburah
-        daath_coord = (0 * self.spacing_factor, 6.75 *
-                       self.spacing_factor + self.vertical_shift)
-        self.daath = Sephirah(
+        # Da'ath is positioned at the geometric center of Chokmah, Binah, Chesed,
+        # and Geburah (rows 1-4 of the coordinates)
+        daath_xy = self._seph_xy[1:5].mean(axis=0)
+        # Da'ath is kept with the other Sephiroth, under number 0
+        daath = Sephirah(
             number=0,
-            name="Da'ath",
-            coord=daath_coord,
-            color=DEFAULT_SEPHIROTH_COLORS[0]
+            name=_SEPHIROTH_NAMES[0],
+            coord=tuple(daath_xy.tolist()),
+            color=DEFAULT_SEPHIROTH_COLOR_TABLE[0]
         )
+        self._assign_sephiroth({0: daath, **self.sephiroth})
+
+    @property
+    def daath(self) -> Optional[Sephirah]:
+        """The hidden Sephirah Da'ath (stored in self.sephiroth under number 0)."""
+        return self._sephiroth.get(0)
+
+    @property
+    def sephiroth(self) -> Mapping[int, Sephirah]:
+        """
+        The Sephiroth, by number (1-10), with Da'ath under number 0.
+
+        The mapping is read-only; assign a new dict to change the Sephiroth.
+        Assigning it refreshes the coordinates, path geometry and color table
+        used while rendering, and drops everything derived from the old
+        elements (the Sephiroth memoized per scheme, render plans, the retained
+        figure and saved files).
+        """
+        return MappingProxyType(self._sephiroth)
+
+    @sephiroth.setter
+    def sephiroth(self, sephiroth: Mapping[int, Sephirah]) -> None:
+        # Copy, so later changes to the caller's dict cannot bypass the setter
+        self._assign_sephiroth(dict(sephiroth))
+        # Sephiroth may have moved: rebuild the geometry drawn from coordinates
+        self._update_coordinates()
+        self._seph_scheme_applied = None
+        # Sephiroth memoized per scheme were built from the replaced elements
+        self._seph_scheme_cache.clear()
+        # Everything rendered from the replaced elements is stale
+        self._drop_render_caches()
+        self._seph_rgba = colors_to_rgba_array(
+            [sephirah.color if sephirah else DEFAULT_SEPHIROTH_COLOR_TABLE[number]
+             for number, sephirah in enumerate(self._seph_list)], dtype=_RGBA_DTYPE)
+
+    def _update_coordinates(self) -> None:
+        """
+        Rebuild the coordinate array, path endpoints and path label geometry
+        from the coordinates of the current Sephiroth.
+        """
+        seph_xy = np.array(
+            [sephirah.coord if sephirah else self._seph_xy[number - 1]
+             for number, sephirah in enumerate(self._seph_list[1:], start=1)], dtype=float)
+        if np.array_equal(seph_xy, self._seph_xy):
+            return
+
+        self._seph_xy = seph_xy
+        self._path_endpoints = self._seph_xy[self._path_idx].reshape(-1, 4)
+        self._init_path_label_geometry(self._path_nums)
+
+    def _drop_render_caches(self) -> None:
+        """Drop the render plans, the retained figure and the saved-file bytes."""
+        self._render_plans.clear()
+        self._retained_scene = None
+        self._saved_outputs.clear()
+
+    def _assign_sephiroth(self, sephiroth: Dict[int, Sephirah]) -> None:
+        """
+        Store a Sephiroth dict built internally, keeping the render caches.
+
+        Args:
+            sephiroth: The Sephiroth, by number (Da'ath under number 0)
+        """
+        self._sephiroth = sephiroth
+        # Sephirah n at index n (index 0 is Da'ath)
+        self._seph_list: List[Optional[Sephirah]] = [
+            sephiroth.get(number) for number in range(11)]
+
+    @property
+    def paths(self) -> Mapping[int, Path]:
+        """
+        The Paths, by number (11-32).
+
+        The mapping is read-only; assign a new dict to change the Paths.
+        Assigning it refreshes the number-indexed list and color table used
+        while rendering, and drops everything derived from the old elements
+        (the Paths memoized per scheme, render plans, the retained figure and
+        saved files).
+        """
+        return MappingProxyType(self._paths)
+
+    @paths.setter
+    def paths(self, paths: Mapping[int, Path]) -> None:
+        # Copy, so later changes to the caller's dict cannot bypass the setter
+        self._assign_paths(dict(paths))
+        self._path_scheme_applied = None
+        # Paths memoized per scheme were built from the replaced elements
+        self._path_scheme_cache.clear()
+        # Everything rendered from the replaced elements is stale
+        self._drop_render_caches()
+        self._path_rgba = colors_to_rgba_array(
+            [paths[number].color if paths.get(number) else DEFAULT_PATH_COLOR_TABLE[number - 11]
+             for number in self._path_row], dtype=_RGBA_DTYPE)
+
+    def _assign_paths(self, paths: Dict[int, Path]) -> None:
+        """
+        Store a Paths dict built internally, keeping the render caches.
+
+        Args:
+            paths: The Paths, by number (11-32)
+        """
+        self._paths = paths
+        # Path n at index n - 11
+        self._path_list: List[Optional[Path]] = [
+            paths.get(number) for number in range(11, 33)]
 
     def set_sephiroth_color_scheme(self, scheme: ColorScheme) -> None:
         """
@@ -291,69 +1143,75 @@ class TreeOfLife:
         """
         self.sephiroth_color_scheme = scheme
 
+        # Nothing to do if this scheme is the one already applied
+        if scheme is self._seph_scheme_applied:
+            return
+
+        # Reuse the Sephiroth built the last time this scheme was applied
+        cached = self._seph_scheme_cache.get(scheme)
+        if cached is not None:
+            sephiroth, self._seph_rgba = cached
+            self._assign_sephiroth(sephiroth)
+            self._seph_scheme_applied = scheme
+            return
+
+        # Render plans built from an earlier, unmemoized state may now be stale
+        self._drop_render_caches()
+
         # Dictionary to store updated Sephiroth with new colors
         updated_sephiroth = {}
 
+        # Whether the result is independent of the previously applied scheme
+        # (only such results can be memoized)
+        complete = True
+
         if scheme == ColorScheme.PLAIN:
-            # Use default colors for the plain scheme
+            # Use default colors for the plain scheme (Da'ath included, as 0)
             for number, sephirah in self.sephiroth.items():
-                color = DEFAULT_SEPHIROTH_COLORS[number]
-                updated_sephiroth[number] = Sephirah(
-                    number=sephirah.number,
-                    name=sephirah.name,
-                    coord=sephirah.coord,
-                    color=color
-                )
-
-            # Update Da'ath separately
-            self.daath = Sephirah(
-                number=self.daath.number,
-                name=self.daath.name,
-                coord=self.daath.coord,
-                color=DEFAULT_SEPHIROTH_COLORS[0]
-            )
+                color = DEFAULT_SEPHIROTH_COLOR_TABLE[number]
+                # Only the styling fields change (records already styled this
+                # way are reused as they are)
+                updated_sephiroth[number] = sephirah.with_color(color, None)
         else:
             # Use colors from the parsed color scales file
             scheme_name = scheme.value
 
-            if not self.color_data or scheme_name not in self.color_data:
-                print(
-                    f"Warning: Color scheme '{scheme_name}' not found. Using default colors.")
+            tables = self._scheme_tables.get(scheme_name)
+            if tables is None:
+                _warn_once(
+                    f"Color scheme '{scheme_name}' not found. Using default colors.")
                 return
+            section = tables['sephiroth']
 
             for number, sephirah in self.sephiroth.items():
-                # Get color data for this sephirah in the selected scheme
-                seph_data = self.color_data[scheme_name]['sephiroth'].get(
-                    number)
-
-                if seph_data:
-                    color = seph_data['color']
-                    effects = seph_data['effects']
-
-                    updated_sephiroth[number] = Sephirah(
-                        number=sephirah.number,
-                        name=sephirah.name,
-                        coord=sephirah.coord,
-                        color=color,
-                        color_effect=effects
-                    )
+                # Look up this sephirah (or Da'ath) in the selected scheme's tables
+                color = section.colors[number]
+
+                if color is not None:
+                    updated_sephiroth[number] = sephirah.with_color(
+                        color, section.effects[number])
                 else:
                     # If no color data found, keep the current color
                     updated_sephiroth[number] = sephirah
-
-            # Handle Da'ath separately
-            daath_data = self.color_data[scheme_name]['sephiroth'].get(0)
-            if daath_data:
-                self.daath = Sephirah(
-                    number=self.daath.number,
-                    name=self.daath.name,
-                    coord=self.daath.coord,
-                    color=daath_data['color'],
-                    color_effect=daath_data['effects']
-                )
+                    complete = False
 
         # Update the sephiroth dictionary with the new colors
-        self.sephiroth = updated_sephiroth
+        self._assign_sephiroth(updated_sephiroth)
+
+        # Pre-parse the new colors once for rendering, in a single pass (the
+        # plain scheme's table and those of complete schemes are shared
+        # process-wide)
+        if scheme == ColorScheme.PLAIN:
+            self._seph_rgba = _plain_sephiroth_rgba()
+        elif complete:
+            self._seph_rgba = section.rgba
+        else:
+            self._seph_rgba = colors_to_rgba_array(
+                [self.sephiroth[number].color for number in range(11)], dtype=_RGBA_DTYPE)
+
+        if complete:
+            self._seph_scheme_cache[scheme] = (self._sephiroth, self._seph_rgba)
+        self._seph_scheme_applied = scheme
 
     def set_path_color_scheme(self, scheme: ColorScheme) -> None:
         """
@@ -364,47 +1222,75 @@ class TreeOfLife:
         """
         self.path_color_scheme = scheme
 
+        # Nothing to do if this scheme is the one already applied
+        if scheme is self._path_scheme_applied:
+            return
+
+        # Reuse the Paths built the last time this scheme was applied
+        cached = self._path_scheme_cache.get(scheme)
+        if cached is not None:
+            paths, self._path_rgba = cached
+            self._assign_paths(paths)
+            self._path_scheme_applied = scheme
+            return
+
+        # Render plans built from an earlier, unmemoized state may now be stale
+        self._drop_render_caches()
+
         # Dictionary to store updated paths with new colors
         updated_paths = {}
 
+        # Whether the result is independent of the previously applied scheme
+        # (only such results can be memoized)
+        complete = True
+
         if scheme == ColorScheme.PLAIN:
             # Use default colors for the plain scheme
             for number, path in self.paths.items():
-                color = DEFAULT_PATH_COLORS[number]
-                updated_paths[number] = Path(
-                    number=path.number,
-                    connects=path.connects,
-                    color=color
-                )
+                color = DEFAULT_PATH_COLOR_TABLE[number - 11]
+                # Only the styling fields change (records already styled this
+                # way are reused as they are)
+                updated_paths[number] = path.with_color(color, None)
         else:
             # Use colors from the parsed color scales file
             scheme_name = scheme.value
 
-            if not self.color_data or scheme_name not in self.color_data:
-                print(
-                    f"Warning: Color scheme '{scheme_name}' not found. Using default colors.")
+            tables = self._scheme_tables.get(scheme_name)
+            if tables is None:
+                _warn_once(
+                    f"Color scheme '{scheme_name}' not found. Using default colors.")
                 return
+            section = tables['paths']
 
             for number, path in self.paths.items():
-                # Get color data for this path in the selected scheme
-                path_data = self.color_data[scheme_name]['paths'].get(number)
-
-                if path_data:
-                    color = path_data['color']
-                    effects = path_data['effects']
-
-                    updated_paths[number] = Path(
-                        number=path.number,
-                        connects=path.connects,
-                        color=color,
-                        color_effect=effects
-                    )
+                # Look up this path in the selected scheme's tables
+                color = section.colors[number - 11]
+
+                if color is not None:
+                    updated_paths[number] = path.with_color(
+                        color, section.effects[number - 11])
                 else:
                     # If no color data found, keep the current color
                     updated_paths[number] = path
+                    complete = False
 
         # Update the paths dictionary with the new colors
-        self.paths = updated_paths
+        self._assign_paths(updated_paths)
+
+        # Pre-parse the new colors once for rendering, in a single pass (the
+        # plain scheme's table is shared process-wide; _path_row is ordered by row)
+        if scheme == ColorScheme.PLAIN:
+            self._path_rgba = _plain_path_rgba(tuple(self._path_row))
+        elif complete:
+            # The scheme's table is indexed by number - 11; gather it into row order
+            self._path_rgba = section.rgba[self._path_nums - 11]
+        else:
+            self._path_rgba = colors_to_rgba_array(
+                [self.paths[number].color for number in self._path_row], dtype=_RGBA_DTYPE)
+
+        if complete:
+            self._path_scheme_cache[scheme] = (self._paths, self._path_rgba)
+        self._path_scheme_applied = scheme
 
     def _calculate_focus_bounds(self, sephiroth_to_draw: set, paths_to_draw: set) -> Tuple[float, float, float, float]:
         """
@@ -440,30 +1326,14 @@ class TreeOfLife:
 
         # Consider midpoints of paths for path numbers/labels
         for path_num in paths_to_draw:
-            if path_num in self.paths:
-                path = self.paths[path_num]
-                i, j = path.connects
-                # Convert from 0-based to 1-based
-                if i+1 in self.sephiroth and j+1 in self.sephiroth:
-                    x1, y1 = self.sephiroth[i+1].coord
-                    x2, y2 = self.sephiroth[j+1].coord
-                    # Path midpoint
-                    mid_x = (x1 + x2) / 2
-                    mid_y = (y1 + y2) / 2
-
-                    # Special cases for paths with offset labels
-                    special_offset_y = 0
-                    if path_num == 13:  # Kether to Tiphereth
-                        special_offset_y = 1.6 * self.spacing_factor
-                    elif path_num == 25:  # Tiphereth to Yesod
-                        special_offset_y = 0.38 * self.spacing_factor
-
-                    mid_y += special_offset_y
-
-                    min_x = min(min_x, mid_x)
-                    max_x = max(max_x, mid_x)
-                    min_y = min(min_y, mid_y)
-                    max_y = max(max_y, mid_y)
+            if path_num in self._path_row:
+                # Label anchor (path midpoint, including any special offset)
+                mid_x, mid_y = self._path_label_xy[self._path_row[path_num]]
+
+                min_x = min(min_x, mid_x)
+                max_x = max(max_x, mid_x)
+                min_y = min(min_y, mid_y)
+                max_y = max(max_y, mid_y)
 
         # Add padding (proportional to the circle radius and spacing factor)
         padding_x = self.circle_radius * 2.5
@@ -497,7 +1367,9 @@ class TreeOfLife:
                save_to_file: Optional[str] = None,
                figsize: Tuple[float, float] = (7.5, 11),
                dpi: int = 300,
-               show_title: bool = False) -> None:
+               show_title: bool = False,
+               rasterize_layers: Tuple[str, ...] = (),
+               save_in_background: bool = False) -> None:
         """
         Render the Tree of Life diagram.
 
@@ -508,18 +1380,24 @@ class TreeOfLife:
             figsize: Size of the figure (width, height) in inches
             dpi: Resolution in dots per inch for saving the figure
             show_title: Whether to display the title on the diagram
+            rasterize_layers: Layers to rasterize when saving to a vector format
+                ('glow' and/or 'paths'), to keep high-overdraw layers out of the
+                vector output; they are rasterized at the given dpi
+            save_in_background: Encode and write the file on a worker thread,
+                returning as soon as the diagram is drawn (headless renders
+                only); call flush_saves to wait for pending saves
         """
-        # Determine which paths and Sephiroth to draw based on focus
-        if focus_sephirah is not None and 1 <= focus_sephirah <= 10:
-            paths_to_draw = self._get_connected_paths(focus_sephirah)
-            sephiroth_to_draw = self._get_connected_sephiroth(focus_sephirah)
-            # Always include the focus sephirah
-            sephiroth_to_draw.add(focus_sephirah)
+        plan = self._get_render_plan(focus_sephirah)
+        min_x, max_x, min_y, max_y = plan.limits
 
-            # Calculate plot limits for the focused view
-            min_x, max_x, min_y, max_y = self._calculate_focus_bounds(
-                sephiroth_to_draw, paths_to_draw)
+        rasterized = frozenset(rasterize_layers)
+        unknown_layers = rasterized - _RASTERIZABLE_LAYERS
+        if unknown_layers:
+            _warn_once(
+                f"Unknown layers to rasterize: {', '.join(sorted(unknown_layers))}. Ignoring them.")
+            rasterized -= unknown_layers
 
+        if focus_sephirah is not None and 1 <= focus_sephirah <= 10:
             # Adjust figure size for focused view to maintain aspect ratio
             width = max_x - min_x
             height = max_y - min_y
@@ -545,40 +1423,123 @@ class TreeOfLife:
 
             adjusted_figsize = (new_width, new_height)
         else:
-            # Draw all paths and Sephiroth
-            paths_to_draw = set(self.paths.keys())
-            sephiroth_to_draw = set(self.sephiroth.keys())
             adjusted_figsize = figsize
 
-        # Setup the plot with potentially adjusted figure size
-        fig, ax = plt.subplots(figsize=adjusted_figsize)
-
-        # Set background color of the figure
-        fig.patch.set_facecolor('#EAEAEA')
-        ax.set_facecolor('#EAEAEA')  # Set background color of the axes area
+        # Everything that affects the drawn figure
+        # (line widths and font sizes are derived from the scale factors at
+        # draw time, so a factor changed after construction must miss)
+        scene_key = (self._plan_key(focus_sephirah), self.sephiroth_text_mode,
+                     self.show_sephiroth_text, self.show_path_text, show_title,
+                     self.sphere_scale_factor, self.spacing_factor,
+                     tuple(adjusted_figsize), _is_vector_format(save_to_file), rasterized)
+
+        # Raster files saved headlessly are reproducible byte for byte, so a
+        # scene saved before is written straight from its encoded bytes
+        # (vector formats embed timestamps, and files without an extension
+        # get one appended by matplotlib, so neither is cached)
+        output_key = None
+        extension = os.path.splitext(str(save_to_file))[1].lower() if save_to_file else ''
+        if not display and extension and not _is_vector_format(save_to_file):
+            # (scene_key covers the plan, text settings and scale factors)
+            output_key = (scene_key, dpi, extension)
+            data = self._saved_outputs.get(output_key)
+            if data is not None:
+                self._saved_outputs.move_to_end(output_key)
+                with open(save_to_file, 'wb') as f:
+                    f.write(data)
+                print(f"Diagram saved to {save_to_file}")
+                return
 
-        if focus_sephirah is not None and 1 <= focus_sephirah <= 10:
-            # Set the plot limits for the focused view
-            ax.set_xlim(min_x, max_x)
-            ax.set_ylim(min_y, max_y)
+        # Draw the diagram, or reuse the figure retained from the previous
+        # headless render if nothing that affects it has changed
+        if not display and self._retained_scene is not None \
+                and self._retained_scene[0] == scene_key:
+            fig = self._retained_scene[1]
         else:
-            # Set plot limits with padding to accommodate the larger spheres and adjusted spacing
-            ax.set_xlim(-4.0, 4.0)
-            ax.set_ylim(-3.5, 15.0)
+            # Setup the plot with potentially adjusted figure size
+            if display:
+                import matplotlib.pyplot as plt
+                fig, ax = plt.subplots(figsize=adjusted_figsize)
+                self._configure_axes(fig, ax, plan.limits)
+            else:
+                fig, ax = self._new_figure(adjusted_figsize, plan.limits)
 
-        # Ensure aspect ratio is equal so circles are not distorted
-        ax.set_aspect('equal', adjustable='box')
+            self._draw_scene(ax, plan, vector=_is_vector_format(save_to_file),
+                             rasterized=rasterized)
 
-        # Hide the axes
-        ax.axis('off')
+            # Add title if enabled
+            if show_title:
+                if focus_sephirah is not None:
+                    sephirah_name = self.sephiroth[focus_sephirah].name
+                    title = f"Focus on {sephirah_name} (Sephirah {focus_sephirah})"
+                    fig.suptitle(title, fontsize=14)
+                else:
+                    pass
+
+            # Keep headless figures for reuse (saving does not modify them)
+            if not display:
+                self._retained_scene = (scene_key, fig)
+
+        # Save the figure if a filename is provided
+        if save_to_file and save_in_background and not display:
+            # The figure is handed over to the worker (saving with a tight
+            # bounding box temporarily resizes it), so it must not be
+            # reused by later renders
+            if self._retained_scene is not None and self._retained_scene[1] is fig:
+                self._retained_scene = None
+            self._pending_saves.append(
+                _save_pool().submit(_save_figure, fig, save_to_file, dpi))
+        elif output_key is not None:
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=extension[1:], dpi=dpi, bbox_inches='tight')
+            data = buffer.getvalue()
+            with open(save_to_file, 'wb') as f:
+                f.write(data)
+            self._saved_outputs[output_key] = data
+            if len(self._saved_outputs) > _SAVED_OUTPUTS_MAX_ENTRIES:
+                self._saved_outputs.popitem(last=False)
+            print(f"Diagram saved to {save_to_file}")
+        elif save_to_file:
+            fig.savefig(save_to_file, dpi=dpi, bbox_inches='tight')
+            print(f"Diagram saved to {save_to_file}")
+
+        # Display the figure if requested (a headless figure was never
+        # registered with pyplot; it is only retained for reuse)
+        if display:
+            plt.show()
+
+    def flush_saves(self) -> None:
+        """
+        Wait until every diagram being saved in the background has been written.
+
+        Errors raised by a background save are re-raised here (the first one,
+        after all pending saves have finished).
+        """
+        pending, self._pending_saves = self._pending_saves, []
+        errors = [future.exception() for future in pending]
+        for error in errors:
+            if error is not None:
+                raise error
+
+    def _draw_scene(self, ax, plan: _RenderPlan, vector: bool = False,
+                    rasterized: FrozenSet[str] = frozenset()) -> None:
+        """
+        Draw the paths, Sephiroth and Da'ath of a render plan onto an axis.
+
+        Args:
+            ax: Matplotlib axis, already configured by _configure_axes
+            plan: The render plan to draw
+            vector: Whether the output is a vector format (see _add_kether_radiant_effect)
+            rasterized: Layers to rasterize in vector output ('glow', 'paths')
+        """
+        # Import matplotlib only when actually rendering
+        from matplotlib.collections import EllipseCollection, LineCollection
 
         # Define visual parameters
         line_color_outer = 'black'
-        line_color_inner = 'white'
         # Increased thickness for path numbers
         line_width_outer = 14.0 * (self.sphere_scale_factor * 0.7)
         line_width_inner = 10.0 * (self.sphere_scale_factor * 0.7)
-        circle_edge_color = 'black'
         # Increased for thicker sephiroth borders
         circle_line_width = 3.0 * (self.sphere_scale_factor * 0.6)
         zorder_paths_outer = 1  # Draw black lines first
@@ -588,193 +1549,57 @@ class TreeOfLife:
         zorder_daath = 2
         zorder_path_numbers = 4  # Draw path numbers on top of everything
 
-        # Identify special paths that need different z-ordering
-        path13_num = 13  # Kether to Tiphereth
-        path14_num = 14  # Chokmah to Binah
-        path15_num = 15  # Chokmah to Tiphereth
-        path17_num = 17  # Binah to Tiphereth
-        path19_num = 19  # Chesed to Geburah
-        path25_num = 25  # Tiphereth to Yesod
-        path27_num = 27  # Netzach to Hod
-
-        # Create lists of special paths
-        paths_underneath = {path13_num, path15_num, path17_num, path25_num}
-        paths_special = {path14_num, path19_num,
-                         path27_num}  # Horizontal paths
-
-        # Draw paths
-        # First handle normal paths
-        for path_num, path in self.paths.items():
-            if path_num not in paths_to_draw:
-                continue
-
-            # Skip special paths for now
-            if path_num in paths_underneath or path_num in paths_special:
-                continue
-
-            # Get sephiroth coordinates
-            i, j = path.connects
-            # Convert from 0-based to 1-based
-            x1, y1 = self.sephiroth[i+1].coord
-            # Convert from 0-based to 1-based
-            x2, y2 = self.sephiroth[j+1].coord
-
-            # Determine path color
-            path_color = path.color
-
-            # Check if we're focusing on a specific sephirah
-            if focus_sephirah is not None:
-                # Get 0-based indices for the focused sephirah
-                focus_idx = focus_sephirah - 1
-
-                # If path connects to focused sephirah, use normal color
-                # Otherwise gray it out
-                if focus_idx not in path.connects:
-                    path_color = '#888888'  # Use gray for non-focused paths
-
-            # Draw the outer black line
-            ax.plot([x1, x2], [y1, y2],
-                    color=line_color_outer,
-                    linewidth=line_width_outer,
-                    solid_capstyle='round',
-                    zorder=zorder_paths_outer)
-
-            # Draw the inner colored line
-            ax.plot([x1, x2], [y1, y2],
-                    color=path_color if path_color != '#888888' else line_color_inner,
-                    linewidth=line_width_inner,
-                    solid_capstyle='round',
-                    zorder=zorder_paths_inner)
-
-            # Apply special effects if any
-            if path.color_effect and path_color != '#888888':
-                apply_path_effect(
-                    ax, path_num, x1, y1, x2, y2, path.color, path.color_effect, self.sphere_scale_factor)
-
-            # Add path number at the midpoint
-            self._add_path_number(ax, path_num, x1, y1,
-                                  x2, y2, zorder_path_numbers)
-
-        # Draw paths that should appear underneath
-        for path_num in paths_underneath:
-            if path_num not in paths_to_draw or path_num not in self.paths:
-                continue
-
-            path = self.paths[path_num]
-            i, j = path.connects
-            x1, y1 = self.sephiroth[i+1].coord
-            x2, y2 = self.sephiroth[j+1].coord
-
-            # Determine path color
-            path_color = path.color
-
-            # Check if we're focusing on a specific sephirah
-            if focus_sephirah is not None:
-                focus_idx = focus_sephirah - 1
-                if focus_idx not in path.connects:
-                    path_color = '#888888'  # Use gray for non-focused paths
-
-            # Draw with lower zorder to ensure it appears underneath
-            ax.plot([x1, x2], [y1, y2],
-                    color=line_color_outer,
-                    linewidth=line_width_outer,
-                    solid_capstyle='round',
-                    zorder=zorder_paths_outer-1)  # Even lower zorder
-
-            ax.plot([x1, x2], [y1, y2],
-                    color=path_color if path_color != '#888888' else line_color_inner,
-                    linewidth=line_width_inner,
-                    solid_capstyle='round',
-                    zorder=zorder_paths_inner-1)  # Even lower zorder
-
-            # Apply special effects if any
-            if path.color_effect and path_color != '#888888':
-                apply_path_effect(
-                    ax, path_num, x1, y1, x2, y2, path.color, path.color_effect, self.sphere_scale_factor)
-
-            # Add path number at the midpoint
-            self._add_path_number(ax, path_num, x1, y1,
-                                  x2, y2, zorder_path_numbers)
-
-        # Draw special horizontal paths
-        for path_num in paths_special:
-            if path_num not in paths_to_draw or path_num not in self.paths:
-                continue
-
-            path = self.paths[path_num]
-            i, j = path.connects
-            x1, y1 = self.sephiroth[i+1].coord
-            x2, y2 = self.sephiroth[j+1].coord
-
-            # Determine path color
-            path_color = path.color
-
-            # Check if we're focusing on a specific sephirah
-            if focus_sephirah is not None:
-                focus_idx = focus_sephirah - 1
-                if focus_idx not in path.connects:
-                    path_color = '#888888'  # Use gray for non-focused paths
-
-            # Draw with different zorder to handle horizontal paths correctly
-            ax.plot([x1, x2], [y1, y2],
-                    color=line_color_outer,
-                    linewidth=line_width_outer,
-                    solid_capstyle='round',
-                    zorder=zorder_paths_outer)
-
-            ax.plot([x1, x2], [y1, y2],
-                    color=path_color if path_color != '#888888' else line_color_inner,
-                    linewidth=line_width_inner,
-                    solid_capstyle='round',
-                    zorder=zorder_paths_inner)
-
-            # Apply special effects if any
-            if path.color_effect and path_color != '#888888':
-                apply_path_effect(
-                    ax, path_num, x1, y1, x2, y2, path.color, path.color_effect, self.sphere_scale_factor)
-
-            # Add path number at the midpoint
-            self._add_path_number(ax, path_num, x1, y1,
-                                  x2, y2, zorder_path_numbers)
-
-        # Draw Sephiroth
-        for seph_num, sephirah in self.sephiroth.items():
-            if seph_num not in sephiroth_to_draw:
+        # Draw paths, one group per z-layer. Each group is drawn as two
+        # LineCollections (outer black stroke + inner colored stroke), so the
+        # whole layer costs two artists instead of two per path.
+        for path_nums, rows, inner_colors, zorder_offset in zip(
+                plan.path_groups, plan.path_rows, plan.path_inner_colors,
+                _PATH_GROUP_ZORDER_OFFSETS):
+            if not path_nums:
                 continue
 
+            # (N, 2, 2) segments sliced straight from the endpoint array
+            segments = self._path_endpoints[rows].reshape(-1, 2, 2)
+
+            for path_num in path_nums:
+                # Apply special effects if any
+                if path_num in plan.path_effects:
+                    path = self._path_list[path_num - 11]
+                    x1, y1, x2, y2 = self._path_endpoints[self._path_row[path_num]]
+                    apply_path_effect(
+                        ax, path_num, x1, y1, x2, y2, path.color, path.color_effect, self.sphere_scale_factor)
+
+                # Add path number at the midpoint
+                self._add_path_number(ax, path_num, zorder_path_numbers)
+
+            # Draw the outer black lines
+            ax.add_collection(LineCollection(
+                segments,
+                colors=line_color_outer,
+                linewidths=line_width_outer,
+                capstyle='round',
+                rasterized='paths' in rasterized,
+                zorder=zorder_paths_outer + zorder_offset))
+
+            # Draw the inner colored lines
+            ax.add_collection(LineCollection(
+                segments,
+                colors=inner_colors,
+                linewidths=line_width_inner,
+                capstyle='round',
+                rasterized='paths' in rasterized,
+                zorder=zorder_paths_inner + zorder_offset))
+
+        # Draw Sephiroth. The circles are added as a single EllipseCollection
+        # after the loop; text and effects stay per-sephirah.
+        for seph_num, text_color in zip(plan.sephiroth, plan.seph_text_colors):
+            sephirah = self._seph_list[seph_num]
             x, y = sephirah.coord
-            color = sephirah.color
-
-            # If focusing on a specific sephirah, gray out all except the focused one
-            if focus_sephirah is not None and seph_num != focus_sephirah:
-                # Gray out connected sephiroth without reducing opacity
-                alpha = 1.0  # Changed from 0.6 to make fully opaque
-                circle_face_color = '#E0E0E0'  # Slightly darker gray for non-focused sephiroth
-                circle_edge_color_override = '#AAAAAA'  # Border is slightly darker gray
-                text_color = '#AAAAAA'  # Match number to darker gray
-            else:
-                alpha = 1.0
-                circle_face_color = color  # Use the sephirah's color
-                circle_edge_color_override = circle_edge_color  # Use default border color
-                # Dynamically determine text color based on background brightness
-                text_color = get_contrasting_text_color(circle_face_color)
-
-            # Draw the circle
-            circle = patches.Circle(
-                (x, y),
-                self.circle_radius,
-                facecolor=circle_face_color,
-                edgecolor=circle_edge_color_override,
-                linewidth=circle_line_width,
-                alpha=alpha,
-                zorder=zorder_circles
-            )
-            ax.add_patch(circle)
 
             # Apply special color effects if any
-            if sephirah.color_effect and (focus_sephirah is None or seph_num == focus_sephirah):
+            if seph_num in plan.seph_effects:
                 apply_color_effect(
-                    ax, 'sephirah', seph_num, x, y, color,
+                    ax, 'sephirah', seph_num, x, y, sephirah.color,
                     sephirah.color_effect, self.circle_radius
                 )
 
@@ -802,50 +1627,60 @@ class TreeOfLife:
                     x, y,
                     display_text,
                     color=text_color,
-                    fontsize=fontsize,
+                    fontproperties=self._bold_font(fontsize),
                     ha='center',
                     va='center',
-                    fontweight='bold',
                     zorder=zorder_circles + 1
                 )
 
             # Special case for Kether (1) - Add radiant effect
             if seph_num == 1:
-                self._add_kether_radiant_effect(ax, x, y)
+                self._add_kether_radiant_effect(
+                    ax, x, y, vector=vector, rasterized='glow' in rasterized)
+
+        # Draw all Sephiroth circles in one collection, sized in data units
+        if plan.sephiroth:
+            num_circles = len(plan.sephiroth)
+            sephiroth_collection = EllipseCollection(
+                widths=np.full(num_circles, 2 * self.circle_radius),
+                heights=np.full(num_circles, 2 * self.circle_radius),
+                angles=np.zeros(num_circles),
+                units='xy',
+                offsets=self._seph_xy[np.array(plan.sephiroth) - 1],
+                offset_transform=ax.transData,
+                facecolors=plan.seph_face_colors,
+                edgecolors=plan.seph_edge_colors,
+                linewidths=circle_line_width,
+                zorder=zorder_circles
+            )
+            sephiroth_collection.set_alpha(plan.seph_alphas)
+            ax.add_collection(sephiroth_collection)
 
         # Draw Da'ath (the hidden Sephirah) if it should be included
         # (either showing all sephiroth or if Kether or Tiphareth is focused)
-        if focus_sephirah is None or focus_sephirah == 1 or focus_sephirah == 6:
+        if plan.daath_style is not None:
             x, y = self.daath.coord
-            color = self.daath.color
-
-            # If focusing on a specific sephirah, gray out Da'ath unless it's directly connected
-            if focus_sephirah is not None:
-                # Use gray for Da'ath when in focus mode
-                daath_border_color = '#AAAAAA'
-
-                # Da'ath isn't directly connected to any nodes, but logically appears
-                # in the vertical pillar between Kether and Tiphereth
-                if focus_sephirah not in [1, 6]:  # If not Kether or Tiphereth
-                    color = '#E0E0E0'  # Use a grayish color for Da'ath's background
-            else:
-                daath_border_color = circle_edge_color
+            face_color, color, daath_border_color, text_color = plan.daath_style
 
             # Da'ath is typically drawn with a dashed line
-            circle = patches.Circle(
-                (x, y),
-                self.circle_radius,
-                facecolor=color,  # Use actual color instead of transparent fill
-                edgecolor=daath_border_color,
-                linewidth=circle_line_width * 0.7,
-                linestyle='dashed',
+            daath_collection = EllipseCollection(
+                widths=2 * self.circle_radius,
+                heights=2 * self.circle_radius,
+                angles=0,
+                units='xy',
+                offsets=[(x, y)],
+                offset_transform=ax.transData,
+                facecolors=face_color,  # Use actual color instead of transparent fill
+                edgecolors=daath_border_color,
+                linewidths=circle_line_width * 0.7,
+                linestyles='dashed',
                 alpha=0.8,
                 zorder=zorder_daath
             )
-            ax.add_patch(circle)
+            ax.add_collection(daath_collection)
 
             # Apply special color effects if any
-            if self.daath.color_effect and (focus_sephirah is None or focus_sephirah in [1, 6]):
+            if plan.daath_effect:
                 apply_color_effect(
                     ax, 'sephirah', 0, x, y, color,
                     self.daath.color_effect, self.circle_radius
@@ -872,47 +1707,264 @@ class TreeOfLife:
                     display_text = ""  # Default to blank if mode is invalid
                     fontsize = 12 * self.sphere_scale_factor
 
-                # Determine text color based on whether we're in focus mode
-                if focus_sephirah is not None:
-                    # In focus mode, always use the gray text color to match other non-focused spheres
-                    text_color = '#AAAAAA'
-                else:
-                    # In normal mode, use contrasting color based on background
-                    text_color = get_contrasting_text_color(color)
-
                 ax.text(
                     x, y,
                     display_text,
                     color=text_color,
-                    fontsize=fontsize,
+                    fontproperties=self._bold_font(fontsize),
                     ha='center',
                     va='center',
-                    fontweight='bold',
                     alpha=0.8,
                     zorder=zorder_daath + 1
                 )
 
-        # Add title if enabled
-        if show_title:
-            if focus_sephirah is not None:
-                sephirah_name = self.sephiroth[focus_sephirah].name
-                title = f"Focus on {sephirah_name} (Sephirah {focus_sephirah})"
-                fig.suptitle(title, fontsize=14)
-            else:
-                pass
+    @staticmethod
+    def _configure_axes(fig, ax, limits: Tuple[float, float, float, float]) -> None:
+        """
+        Apply the common background, limits and axis styling to a new figure.
 
-        # Save the figure if a filename is provided
-        if save_to_file:
-            plt.savefig(save_to_file, dpi=dpi, bbox_inches='tight')
-            print(f"Diagram saved to {save_to_file}")
+        Args:
+            fig: Matplotlib figure to configure
+            ax: Matplotlib axis of the figure
+            limits: Plot limits as (min_x, max_x, min_y, max_y)
+        """
+        min_x, max_x, min_y, max_y = limits
 
-        # Display the figure if requested
-        if display:
-            plt.show()
+        # Set background color of the figure
+        fig.patch.set_facecolor('#EAEAEA')
+        ax.set_facecolor('#EAEAEA')  # Set background color of the axes area
+
+        # Set the plot limits (focused view, or the full tree with padding to
+        # accommodate the larger spheres and adjusted spacing)
+        ax.set_xlim(min_x, max_x)
+        ax.set_ylim(min_y, max_y)
+
+        # Ensure aspect ratio is equal so circles are not distorted
+        ax.set_aspect('equal', adjustable='box')
+
+        # Hide the axes
+        ax.axis('off')
+
+    def _new_figure(self, figsize: Tuple[float, float],
+                    limits: Tuple[float, float, float, float]) -> Tuple[Any, Any]:
+        """
+        Create a blank, configured figure for a headless render.
+
+        The first figure for a given size and limits is built and configured
+        normally, then pickled as a template; later renders unpickle a copy of
+        the template instead of repeating the setup.
+
+        Args:
+            figsize: Figure size in inches
+            limits: Plot limits as (min_x, max_x, min_y, max_y)
+
+        Returns:
+            Tuple of (figure, axis), drawing on a bare Agg canvas
+        """
+        # Headless render: draw on a bare Agg canvas, bypassing pyplot's
+        # global figure manager and any interactive backend setup
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        key = (tuple(figsize), limits)
+        template = self._figure_templates.get(key)
+        if template is not None:
+            fig = pickle.loads(template)
+            FigureCanvasAgg(fig)
+            return fig, fig.axes[0]
+
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        self._configure_axes(fig, ax, limits)
+
+        self._figure_templates[key] = pickle.dumps(
+            fig, protocol=pickle.HIGHEST_PROTOCOL)
+        return fig, ax
+
+    def _plan_key(self, focus_sephirah: Optional[int]) -> Tuple[Optional[int], ColorScheme, ColorScheme]:
+        """
+        Get the key identifying the render plan for a focus under the current schemes.
+
+        Args:
+            focus_sephirah: The focused Sephirah (1-10), or None for the full tree
+
+        Returns:
+            Tuple of (focus, Sephiroth color scheme, path color scheme)
+        """
+        return (focus_sephirah, self.sephiroth_color_scheme, self.path_color_scheme)
+
+    def _get_render_plan(self, focus_sephirah: Optional[int]) -> _RenderPlan:
+        """
+        Get the render plan for a focus, reusing it across renders.
+
+        Plans are memoized per (focus, sephiroth scheme, path scheme), so
+        repeated renders of the same view skip all filtering and color work.
+
+        Args:
+            focus_sephirah: The focused Sephirah (1-10), or None for the full tree
+
+        Returns:
+            The render plan for the current color schemes
+        """
+        key = self._plan_key(focus_sephirah)
+        plan = self._render_plans.get(key)
+        if plan is None:
+            plan = self._compile_render_plan(focus_sephirah)
+            self._render_plans[key] = plan
+        return plan
+
+    def _compile_render_plan(self, focus_sephirah: Optional[int]) -> _RenderPlan:
+        """
+        Work out which elements to draw for a focus, and how to color them.
+
+        Args:
+            focus_sephirah: The focused Sephirah (1-10), or None for the full tree
+
+        Returns:
+            A new render plan reflecting the current Sephiroth and Paths
+        """
+        # Which paths (by row) touch the focused sephirah; with no focus every
+        # path counts as touched, and an out-of-range focus touches none
+        if focus_sephirah is None:
+            touches = np.ones(len(self._path_row), dtype=bool)
+        elif 1 <= focus_sephirah <= 10:
+            touches = self._path_touches[focus_sephirah - 1]
+        else:
+            touches = np.zeros(len(self._path_row), dtype=bool)
+
+        # Determine which paths and Sephiroth to draw based on focus
+        if focus_sephirah is not None and 1 <= focus_sephirah <= 10:
+            # The touching paths, and the Sephiroth at either end of them
+            # (always including the focus sephirah), as one mask over indices
+            seph_mask = np.zeros(10, dtype=bool)
+            seph_mask[focus_sephirah - 1] = True
+            seph_mask[self._path_idx[touches]] = True
+            paths_to_draw = set(self._path_nums[touches].tolist())
+            sephiroth_to_draw = set((np.flatnonzero(seph_mask) + 1).tolist())
+
+            # Calculate plot limits for the focused view
+            limits = self._calculate_focus_bounds(
+                sephiroth_to_draw, paths_to_draw)
         else:
-            plt.close(fig)
+            # Draw all paths and Sephiroth
+            paths_to_draw = set(self.paths.keys())
+            sephiroth_to_draw = set(self.sephiroth.keys())
+            limits = (-4.0, 4.0, -3.5, 15.0)
+
+        line_color_inner = np.array(hex_to_rgba('#FFFFFF'), dtype=_RGBA_DTYPE)
+        circle_edge_color = 'black'
+
+        # Sort the paths to draw into their z-layer groups in a single pass
+        grouped_paths: List[List[int]] = [[] for _ in _PATH_GROUP_ZORDER_OFFSETS]
+        for path_num, path in enumerate(self._path_list, start=11):
+            if path is not None and path_num in paths_to_draw:
+                grouped_paths[self._path_category[path_num]].append(path_num)
+
+        path_groups = []
+        path_rows = []
+        path_inner_colors = []
+        path_effects = set()
+        for path_nums in grouped_paths:
+            rows = [self._path_row[path_num] for path_num in path_nums]
+
+            # Paths not touching the focused sephirah are grayed out: their inner
+            # line is drawn plain and their special effects are skipped
+            touched = touches[rows]
+            inner_colors = np.where(
+                touched[:, None], self._path_rgba[rows], line_color_inner)
+
+            path_effects.update(
+                path_num for path_num, is_touched in zip(path_nums, touched)
+                if is_touched and self._path_list[path_num - 11].color_effect)
+
+            path_groups.append(tuple(path_nums))
+            path_rows.append(np.array(rows, dtype=np.intp))
+            path_inner_colors.append(inner_colors.reshape(-1, 4))
+
+        # Work out the styling of each sephirah to draw
+        sephiroth = []
+        seph_face_colors = []
+        seph_edge_colors = []
+        seph_alphas = []
+        seph_text_colors = []
+        seph_effects = set()
+        # (Da'ath, at index 0, is styled separately below)
+        for seph_num, sephirah in enumerate(self._seph_list[1:], start=1):
+            if sephirah is None or seph_num not in sephiroth_to_draw:
+                continue
+
+            # If focusing on a specific sephirah, gray out all except the focused one
+            if focus_sephirah is not None and seph_num != focus_sephirah:
+                # Gray out connected sephiroth without reducing opacity
+                alpha = 1.0  # Changed from 0.6 to make fully opaque
+                circle_face_color = hex_to_rgba('#E0E0E0')  # Slightly darker gray for non-focused sephiroth
+                circle_edge_color_override = '#AAAAAA'  # Border is slightly darker gray
+                text_color = '#AAAAAA'  # Match number to darker gray
+            else:
+                alpha = 1.0
+                circle_face_color = self._seph_rgba[seph_num]  # Use the sephirah's color
+                circle_edge_color_override = circle_edge_color  # Use default border color
+                # Dynamically determine text color based on background brightness
+                text_color = get_contrasting_text_color(sephirah.color)
+
+            sephiroth.append(seph_num)
+            seph_face_colors.append(circle_face_color)
+            seph_edge_colors.append(circle_edge_color_override)
+            seph_alphas.append(alpha)
+            seph_text_colors.append(text_color)
+
+            # Special color effects are only drawn on non-grayed Sephiroth
+            if sephirah.color_effect and (focus_sephirah is None or seph_num == focus_sephirah):
+                seph_effects.add(seph_num)
+
+        # Da'ath is included when showing all sephiroth or if Kether or
+        # Tiphareth is focused
+        daath_style = None
+        daath_effect = False
+        if focus_sephirah is None or focus_sephirah == 1 or focus_sephirah == 6:
+            color = self.daath.color
+            face_color = self._seph_rgba[0]
+
+            # If focusing on a specific sephirah, gray out Da'ath unless it's directly connected
+            if focus_sephirah is not None:
+                # Use gray for Da'ath when in focus mode
+                daath_border_color = '#AAAAAA'
+
+                # Da'ath isn't directly connected to any nodes, but logically appears
+                # in the vertical pillar between Kether and Tiphereth
+                if focus_sephirah not in [1, 6]:  # If not Kether or Tiphereth
+                    color = face_color = '#E0E0E0'  # Use a grayish color for Da'ath's background
+
+                # In focus mode, always use the gray text color to match other non-focused spheres
+                text_color = '#AAAAAA'
+            else:
+                daath_border_color = circle_edge_color
+
+                # In normal mode, use contrasting color based on background
+                text_color = get_contrasting_text_color(color)
+
+            daath_style = (face_color, color, daath_border_color, text_color)
+            daath_effect = bool(self.daath.color_effect) and (
+                focus_sephirah is None or focus_sephirah in [1, 6])
+
+        return _RenderPlan(
+            limits=limits,
+            path_groups=tuple(path_groups),
+            path_rows=tuple(path_rows),
+            path_inner_colors=tuple(path_inner_colors),
+            path_effects=frozenset(path_effects),
+            sephiroth=tuple(sephiroth),
+            seph_face_colors=np.array(seph_face_colors, dtype=_RGBA_DTYPE).reshape(-1, 4),
+            seph_edge_colors=tuple(seph_edge_colors),
+            seph_alphas=tuple(seph_alphas),
+            seph_text_colors=tuple(seph_text_colors),
+            seph_effects=frozenset(seph_effects),
+            daath_style=daath_style,
+            daath_effect=daath_effect,
+        )
 
-    def _get_connected_paths(self, sephirah_num: int) -> set:
+    def _get_connected_paths(self, sephirah_num: int) -> FrozenSet[int]:
         """
         Get the set of path numbers that connect to the given sephirah.
 
@@ -922,135 +1974,60 @@ class TreeOfLife:
         Returns:
             Set of path numbers (11-32) that connect to the sephirah
         """
-        connected_paths = set()
-        sephirah_idx = sephirah_num - 1  # Convert to 0-based index
-
-        for path_num, path in self.paths.items():
-            if sephirah_idx in path.connects:
-                connected_paths.add(path_num)
-
-        return connected_paths
+        return self._paths_by_seph.get(sephirah_num, frozenset())
 
-    def _get_connected_sephiroth(self, sephirah_num: int) -> set:
+    def _get_connected_sephiroth(self, sephirah_num: int) -> FrozenSet[int]:
         """
         Get the set of sephiroth that are directly connected to the given sephirah.
 
+        Da'ath (0) is considered connected to Sephiroth 1-6.
+
         Args:
             sephirah_num: The sephirah number (1-10)
 
         Returns:
-            Set of sephirah numbers (1-10) that are connected to the given sephirah
+            Set of sephirah numbers (0-10) that are connected to the given sephirah
         """
-        connected_sephiroth = set()
-        sephirah_idx = sephirah_num - 1  # Convert to 0-based index
+        return self._neighbors.get(sephirah_num, frozenset())
 
-        for path in self.paths.values():
-            if sephirah_idx in path.connects:
-                # Get the other sephirah connected by this path
-                other_idx = path.connects[0] if path.connects[1] == sephirah_idx else path.connects[1]
-                # Convert back to 1-based
-                connected_sephiroth.add(other_idx + 1)
+    def _bold_font(self, size: float):
+        """
+        Get the shared bold FontProperties for a font size.
 
-        # Check if Da'ath (0) should be included
-        # For simplicity, consider Da'ath connected to Sephiroth 1-6
-        if 1 <= sephirah_num <= 6:
-            connected_sephiroth.add(0)  # Add Da'ath
+        Building FontProperties from fontsize/fontweight kwargs on every text
+        call is repeated work, so one instance per size is kept and reused.
 
-        return connected_sephiroth
+        Args:
+            size: Font size in points
 
-    def _add_path_number(self, ax, path_num: int, x1: float, y1: float, x2: float, y2: float, zorder: int) -> None:
+        Returns:
+            A bold matplotlib FontProperties of the given size
+        """
+        font = self._bold_fonts.get(size)
+        if font is None:
+            from matplotlib.font_manager import FontProperties
+            font = self._bold_fonts[size] = FontProperties(weight='bold', size=size)
+        return font
+
+    def _add_path_number(self, ax, path_num: int, zorder: int) -> None:
         """
         Add the path number at the midpoint of the path, including astrological/elemental symbols.
 
         Args:
             ax: Matplotlib axis
             path_num: Path number (11-32)
-            x1, y1: Coordinates of the first endpoint
-            x2, y2: Coordinates of the second endpoint
             zorder: Z-order for drawing
         """
         # Only proceed if path text should be shown
         if not self.show_path_text:
             return
 
-        # Calculate midpoint
-        mid_x = (x1 + x2) / 2
-        mid_y = (y1 + y2) / 2
-
-        # Define astrological and elemental symbols for each path (ordered by path number 11-32)
-        path_symbols = {
-            11: '△̵',  # Air - Kether to Chokmah
-            12: '☿',   # Mercury - Kether to Binah
-            13: '☽',   # Moon - Kether to Tiphereth
-            14: '♀',   # Venus - Chokmah to Binah
-            15: '♒',   # Aquarius - Chokmah to Tiphereth
-            16: '♉',   # Taurus - Chokmah to Chesed
-            17: '♊',   # Gemini - Binah to Tiphereth
-            18: '♋',   # Cancer - Binah to Geburah
-            19: '♌',   # Leo - Chesed to Geburah
-            20: '♍',   # Virgo - Chesed to Tiphereth
-            21: '♃',   # Jupiter - Chesed to Netzach
-            22: '♎',   # Libra - Geburah to Tiphereth
-            23: '▽',   # Water - Geburah to Hod
-            24: '♏',   # Scorpio - Tiphereth to Netzach
-            25: '♐',   # Sagittarius - Tiphereth to Yesod
-            26: '♑',   # Capricorn - Tiphereth to Hod
-            27: '♂',   # Mars - Netzach to Hod
-            28: '♈',   # Aries - Netzach to Yesod
-            29: '♓',   # Pisces - Netzach to Malkuth
-            30: '☉',   # Sun - Hod to Yesod
-            31: '△ ⊙',  # Fire & Spirit - Hod to Malkuth
-            32: '♄\n▽̵'  # Saturn & Earth - Yesod to Malkuth
-        }
-
-        # Define paths needing orientation fixes (appearing upside down)
-        paths_needing_orientation_fix = [12, 15, 20, 26, 28, 29]
-
-        # Define special path offsets for paths that need custom positioning
-        special_offset_y = 0
-
-        # Path 13 (Kether to Tiphereth) needs to be higher
-        if path_num == 13:
-            special_offset_y = 1.6 * self.spacing_factor
+        # Look up the label text and geometry precomputed in _init_paths
+        row = self._path_row[path_num]
+        label_x, label_y = self._path_label_xy[row]
 
-        # Path 25 (Tiphereth to Yesod) needs to be raised a bit
-        if path_num == 25:
-            special_offset_y = 0.38 * self.spacing_factor
-
-        # Calculate the angle of the path for text rotation
-        angle_rad = np.arctan2(y2 - y1, x2 - x1)
-        angle_deg = np.degrees(angle_rad)
-
-        # Adjust angle for readability - text should be right-side up
-        if 90 < angle_deg < 270:
-            angle_deg -= 180
-
-        # Force flip for specific paths that are rendering upside down
-        if path_num in paths_needing_orientation_fix:
-            angle_deg += 180
-
-        # Determine if the path is vertical or horizontal
-        # within 5 degrees of vertical
-        is_vertical = abs(abs(angle_deg) - 90) < 5
-        is_horizontal = abs(angle_deg) < 5 or abs(
-            abs(angle_deg) - 180) < 5  # within 5 degrees of horizontal
-
-        # Set final rotation angle
-        if is_vertical or is_horizontal:
-            rotation = 0  # Keep horizontal for vertical and horizontal paths
-        else:
-            rotation = angle_deg  # Rotate text to match path angle
-
-        # Create combined label with path number and symbol
-        if path_num == 32 or is_vertical:
-            # For path 32 and vertical paths, stack number and symbol
-            path_label = f"{path_num}\n{path_symbols[path_num]}"
-        else:
-            # For horizontal and diagonal paths, put symbol next to number
-            path_label = f"{path_num} {path_symbols[path_num]}"
-
-        # Get the path color from the paths dictionary
-        path = self.paths.get(path_num)
+        # Get the path color from the number-indexed paths list
+        path = self._path_list[path_num - 11]
         path_color = path.color if path else '#888888'
 
         # Dynamic text color based on path color
@@ -1058,40 +2035,63 @@ class TreeOfLife:
         if path_color != '#888888':  # Only change for focused paths (non-gray)
             text_color = get_contrasting_text_color(path_color)
 
-        # Draw text without background or border
-        ax.text(
-            mid_x, mid_y + special_offset_y,
-            path_label,
-            fontsize=9 * self.sphere_scale_factor * 0.55,  # Slightly smaller font
-            fontweight='bold',
-            ha='center',
-            va='center',
+        # Reuse one font for all path labels (slightly smaller, bold)
+        font = self._bold_font(9 * self.sphere_scale_factor * 0.55)
+
+        # Draw text without background or border. The Text is built directly
+        # rather than through ax.text, skipping its kwarg normalization.
+        from matplotlib.text import Text
+        ax.add_artist(Text(
+            label_x, label_y,
+            self._path_labels[row],
+            fontproperties=font,
             color=text_color,
-            rotation=rotation,
-            rotation_mode='anchor',
-            zorder=zorder
-        )
+            rotation=self._path_rotation[row],
+            zorder=zorder,
+            **_PATH_LABEL_TEXT_KW
+        ))
 
-    def _add_kether_radiant_effect(self, ax, x: float, y: float) -> None:
+    def _add_kether_radiant_effect(self, ax, x: float, y: float, vector: bool = False,
+                                   rasterized: bool = False) -> None:
         """
         Add a radiant effect around Kether (first Sephirah).
 
         Args:
             ax: Matplotlib axis
             x, y: Center coordinates of Kether
+            vector: Draw the glow as vector rings (for vector output formats)
+                instead of a single raster image
+            rasterized: Rasterize the vector rings in vector output
         """
-        # Create a radiant glow effect
-        for i in range(20, 0, -2):
-            # Decrease alpha and increase size as we move outward
-            alpha = i / 40.0  # 0.5 to 0.025
-            size = self.circle_radius * (1 + (20 - i) / 10.0)  # 1.0r to 3.0r
-
-            glow = patches.Circle(
-                (x, y),
-                size,
-                facecolor='white',
-                edgecolor='none',
-                alpha=alpha,
+        if vector:
+            from matplotlib.collections import EllipseCollection
+
+            # Decrease alpha and increase size as we move outward, drawing
+            # all rings as one collection (precomputed in __init__)
+            num_rings = len(self._glow_diameters)
+            facecolors = np.ones((num_rings, 4))
+            facecolors[:, 3] = self._glow_alphas
+
+            ax.add_collection(EllipseCollection(
+                widths=self._glow_diameters,
+                heights=self._glow_diameters,
+                angles=0,
+                units='xy',
+                offsets=np.tile((x, y), (num_rings, 1)),
+                offset_transform=ax.transData,
+                facecolors=facecolors,
+                edgecolors='none',
+                rasterized=rasterized,
                 zorder=1  # Below the main circle
-            )
-            ax.add_patch(glow)
+            ))
+            return
+
+        # Draw the radiant glow as a single image artist spanning 3 radii
+        extent = 3.0 * self.circle_radius
+        ax.imshow(
+            _kether_glow_image(),
+            extent=(x - extent, x + extent, y - extent, y + extent),
+            origin='lower',
+            interpolation='bilinear',
+            zorder=1  # Below the main circle
+        )
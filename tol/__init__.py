@@ -9,7 +9,8 @@ and rendering the Kabbalistic Tree of Life diagram.
 from .TreeOfLife import TreeOfLife, ColorScheme, Sephirah, Path
 from .color_utils import (
     ColorEffect, ColorParser, apply_color_effect,
-    apply_path_effect, blend_colors, get_contrasting_text_color
+    apply_path_effect, blend_colors, get_contrasting_text_color, hex_to_rgba,
+    colors_to_rgba_array
 )
 
 # Define what's accessible when doing "from tol import *"
@@ -23,5 +24,7 @@ __all__ = [
     'apply_color_effect',
     'apply_path_effect',
     'blend_colors',
-    'get_contrasting_text_color'
+    'get_contrasting_text_color',
+    'hex_to_rgba',
+    'colors_to_rgba_array'
 ]
@@ -1,9 +1,31 @@
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional, Any
-import matplotlib.colors as mcolors
-import yaml
+from functools import lru_cache
+from typing import Dict, Optional, Any, Tuple, List
+import sys
 import numpy as np
-import matplotlib.patches as patches
+
+# NOTE: yaml is imported lazily (see _yaml_safe_loader), since parsed color
+# scales are normally served from a cache and importing it is a large part
+# of this module's import time
+
+
+@lru_cache(maxsize=1)
+def _yaml_safe_loader():
+    """
+    Get the YAML safe loader class, importing PyYAML on first use.
+
+    Prefers the LibYAML-backed C loader when PyYAML was built with it (much
+    faster), falling back to the pure-Python safe loader otherwise.
+
+    Returns:
+        The yaml.CSafeLoader class if available, else yaml.SafeLoader
+    """
+    try:
+        from yaml import CSafeLoader as YamlSafeLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlSafeLoader
+    return YamlSafeLoader
 
 
 class ColorScheme(Enum):
@@ -15,8 +37,27 @@ class ColorScheme(Enum):
     PRINCESS_SCALE = "princess"
 
 
-# Define type aliases for clarity
-ColorEffect = Dict[str, Any]  # Stores special color effect information
+@dataclass(slots=True, frozen=True)
+class ColorEffect:
+    """Data structure to store a special color effect (flecked, rayed, tinged)."""
+    kind: str  # Effect type ('flecked', 'rayed' or 'tinged')
+    color2: Optional[str] = None  # Name of the second color, if any
+    color2_hex: Optional[str] = None  # Hex value of the second color, if any
+    # (name, hex) pairs for effects offering several colors (e.g. multicolored flecks)
+    colors: Tuple[Tuple[Optional[str], str], ...] = ()
+    # Hex value of the second color, resolved once on creation: color2_hex,
+    # else the first listed color, else white
+    second_color: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.color2_hex is not None:
+            second_color = self.color2_hex
+        elif self.colors:
+            second_color = self.colors[0][1]
+        else:
+            second_color = '#FFFFFF'
+        # Frozen, so bypass the dataclass __setattr__
+        object.__setattr__(self, 'second_color', second_color)
 
 
 class ColorParser:
@@ -36,16 +77,18 @@ class ColorParser:
             Dictionary with structure:
             {
                 'king': {
-                    'sephiroth': {1: {'color': '#FFFFFF', 'effects': {...}}, ...},
-                    'paths': {11: {'color': '#FFFFC0', 'effects': {...}}, ...}
+                    'sephiroth': {1: {'color': '#FFFFFF', 'effects': ColorEffect(...)}, ...},
+                    'paths': {11: {'color': '#FFFFC0', 'effects': None}, ...}
                 },
                 'queen': {...},
                 ...
             }
         """
+        import yaml
+
         try:
             with open(file_path, 'r') as f:
-                yaml_data = yaml.safe_load(f)
+                yaml_data = yaml.load(f, Loader=_yaml_safe_loader())
         except FileNotFoundError:
             print(f"Color scales file not found at {file_path}")
             return {}
@@ -61,92 +104,145 @@ class ColorParser:
             'princess': {'sephiroth': {}, 'paths': {}}
         }
 
-        # Process each scale from the YAML file
-        if 'scales' in yaml_data:
-            for scale_name, scale_data in yaml_data['scales'].items():
-                if scale_name not in result:
-                    continue  # Skip unexpected scales
-
-                # Process sephiroth
-                if 'sephiroth' in scale_data:
-                    for sephirah in scale_data['sephiroth']:
-                        number = sephirah['number']
-                        color_info = {
-                            'color': sephirah['hex'],
-                            'effects': None
-                        }
-
-                        # Handle special effects
-                        if 'effect' in sephirah:
-                            effect_type = sephirah['effect'].get('type')
-                            if effect_type:
-                                effects = {'type': effect_type}
-
-                                if 'color' in sephirah['effect'] and 'hex' in sephirah['effect']:
-                                    effects['color2'] = sephirah['effect']['color']
-                                    effects['color2_hex'] = sephirah['effect']['hex']
-                                elif 'colors' in sephirah['effect']:
-                                    # Handle multiple fleck colors
-                                    effects['colors'] = sephirah['effect']['colors']
-
-                                color_info['effects'] = effects
-
-                        result[scale_name]['sephiroth'][number] = color_info
-
-                # Process paths
-                if 'paths' in scale_data:
-                    for path in scale_data['paths']:
-                        number = path['number']
-                        color_info = {
-                            'color': path['hex'],
-                            'effects': None
-                        }
-
-                        # Handle special effects
-                        if 'effect' in path:
-                            effect_type = path['effect'].get('type')
-                            if effect_type:
-                                effects = {'type': effect_type}
-
-                                if 'color' in path['effect'] and 'hex' in path['effect']:
-                                    effects['color2'] = path['effect']['color']
-                                    effects['color2_hex'] = path['effect']['hex']
-                                elif 'colors' in path['effect']:
-                                    # Handle multiple fleck colors
-                                    effects['colors'] = path['effect']['colors']
-
-                                color_info['effects'] = effects
-
-                        result[scale_name]['paths'][number] = color_info
+        # Process each scale from the YAML file. The Sephiroth and Paths
+        # sections share one layout, so a single loop handles both
+        extract_entry = ColorParser._extract_entry
+        for scale_name, scale_data in (yaml_data.get('scales') or {}).items():
+            scale_result = result.get(scale_name)
+            if scale_result is None:
+                continue  # Skip unexpected scales
+
+            for section in ('sephiroth', 'paths'):
+                # Each entry yields a (number, color_info) pair
+                scale_result[section].update(
+                    map(extract_entry, scale_data.get(section, ())))
 
         return result
 
+    @staticmethod
+    def _extract_entry(entry: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Extract the color information of one Sephirah or Path entry.
+
+        Args:
+            entry: A parsed entry of a scale's sephiroth or paths list
+
+        Returns:
+            Tuple of (number, {'color': hex, 'effects': ColorEffect or None})
+        """
+        # Hex strings are interned: the same few colors recur across every
+        # scale, so all their uses share one string object each
+        color_info = {
+            'color': sys.intern(entry['hex']),
+            'effects': None
+        }
+
+        # Handle special effects (looking the effect up once)
+        effect = entry.get('effect')
+        if effect:
+            effect_type = effect.get('type')
+            if effect_type:
+                if 'color' in effect and 'hex' in effect:
+                    color_info['effects'] = ColorEffect(
+                        effect_type, color2=effect['color'], color2_hex=sys.intern(effect['hex']))
+                elif 'colors' in effect:
+                    # Handle multiple fleck colors
+                    color_info['effects'] = ColorEffect(effect_type, colors=tuple(
+                        (option.get('color'), sys.intern(option.get('hex', '#FFFFFF')))
+                        for option in effect['colors']))
+                else:
+                    color_info['effects'] = ColorEffect(effect_type)
+
+        return entry['number'], color_info
+
+
+# Default colors for sephiroth and paths, as tuples indexed by number
+# (Sephiroth: 0-10, where 0 is Da'ath; paths: number - 11)
+DEFAULT_SEPHIROTH_COLOR_TABLE: Tuple[str, ...] = (
+    "#FFFFFF",   # Da'ath - Lavender
+    "#FFFFFF",   # Kether - White
+    "#FFFFFF",   # Chokmah - Pale Blue
+    "#FFFFFF",   # Binah - Crimson
+    "#FFFFFF",   # Chesed - Deep Violet
+    "#FFFFFF",   # Geburah - Orange
+    "#FFFFFF",   # Tiphereth - Pink
+    "#FFFFFF",   # Netzach - Amber
+    "#FFFFFF",   # Hod - Lavender
+    "#FFFFFF",   # Yesod - Indigo
+    "#FFFFFF"    # Malkuth - Yellow
+)
+
+# Use a neutral color for all paths in the default scheme
+# This will be overridden by specific color schemes
+DEFAULT_PATH_COLOR_TABLE: Tuple[str, ...] = ("#FFFFFF",) * 22
+
+# The same defaults keyed by number, for callers that look colors up by key
+DEFAULT_SEPHIROTH_COLORS = dict(enumerate(DEFAULT_SEPHIROTH_COLOR_TABLE))
+DEFAULT_PATH_COLORS = dict(enumerate(DEFAULT_PATH_COLOR_TABLE, start=11))
+
+
+@lru_cache(maxsize=512)
+def _hex_to_rgb(color: str) -> Tuple[float, float, float]:
+    """
+    Convert a color string to an RGB tuple, parsing each distinct string only once.
+
+    Args:
+        color: Color (as hex string)
+
+    Returns:
+        Tuple of (r, g, b) floats in the range 0.0 to 1.0
+    """
+    return hex_to_rgba(color)[:3]
+
+
+@lru_cache(maxsize=512)
+def hex_to_rgba(color: str) -> Tuple[float, float, float, float]:
+    """
+    Convert a color string to an RGBA tuple, parsing each distinct string only once.
+
+    Args:
+        color: Color (as hex string)
+
+    Returns:
+        Tuple of (r, g, b, a) floats in the range 0.0 to 1.0
+    """
+    # Fast path for "#RRGGBB" strings, which is all the color scales use;
+    # this keeps scheme changes free of matplotlib's generic color parser
+    if len(color) == 7 and color[0] == '#' and color[1:].isalnum():
+        try:
+            value = int(color[1:], 16)
+        except ValueError:
+            pass
+        else:
+            return ((value >> 16) / 255, ((value >> 8) & 0xFF) / 255,
+                    (value & 0xFF) / 255, 1.0)
+
+    # Import matplotlib only when a color actually needs its parser
+    import matplotlib.colors as mcolors
+    return mcolors.to_rgba(color)
+
+
+def colors_to_rgba_array(colors: List[str], dtype: Any = np.float64) -> np.ndarray:
+    """
+    Convert a sequence of colors to an (N, 4) array of RGBA values in one pass.
+
+    Each color goes through the cached hex_to_rgba, so matplotlib is only
+    imported for colors that are not "#RRGGBB" strings.
 
-# Default colors for sephiroth and paths
-DEFAULT_SEPHIROTH_COLORS = {
-    0: "#FFFFFF",   # Da'ath - Lavender
-    1: "#FFFFFF",   # Kether - White
-    2: "#FFFFFF",   # Chokmah - Pale Blue
-    3: "#FFFFFF",   # Binah - Crimson
-    4: "#FFFFFF",   # Chesed - Deep Violet
-    5: "#FFFFFF",   # Geburah - Orange
-    6: "#FFFFFF",   # Tiphereth - Pink
-    7: "#FFFFFF",   # Netzach - Amber
-    8: "#FFFFFF",   # Hod - Lavender
-    9: "#FFFFFF",   # Yesod - Indigo
-    10: "#FFFFFF"   # Malkuth - Yellow
-}
-
-DEFAULT_PATH_COLORS = {
-    # Use a neutral color for all paths in the default scheme
-    # This will be overridden by specific color schemes
-    i: "#FFFFFF" for i in range(11, 33)
-}
+    Args:
+        colors: Colors (as hex strings or Matplotlib color names)
+        dtype: Floating-point type of the array
 
+    Returns:
+        Array with one row of RGBA values (0.0 to 1.0) per color
+    """
+    return np.array([hex_to_rgba(color) for color in colors], dtype=dtype).reshape(-1, 4)
 
+
+@lru_cache(maxsize=256)
 def blend_colors(color1: str, color2: str, ratio: float = 0.8) -> str:
     """
-    Blend two colors together with the given ratio.
+    Blend two colors together with the given ratio, computing each distinct blend only once.
 
     Args:
         color1: First color (as hex string)
@@ -156,16 +252,89 @@ def blend_colors(color1: str, color2: str, ratio: float = 0.8) -> str:
     Returns:
         Blended color as hex string
     """
-    # Convert hex strings to RGB
-    rgb1 = mcolors.to_rgb(color1)
-    rgb2 = mcolors.to_rgb(color2)
+    # Convert hex strings to RGB (cached per color string)
+    rgb1 = _hex_to_rgb(color1)
+    rgb2 = _hex_to_rgb(color2)
 
     # Blend the colors
     blended_rgb = tuple(c1 * ratio + c2 * (1 - ratio)
                         for c1, c2 in zip(rgb1, rgb2))
 
-    # Convert back to hex
-    return mcolors.to_hex(blended_rgb)
+    # Convert back to hex directly, rounding and formatting the way
+    # matplotlib's to_hex does, without importing matplotlib
+    return "#{:02x}{:02x}{:02x}".format(*(round(c * 255) for c in blended_rgb))
+
+
+def _fleck_collection(ax, offsets: np.ndarray, radii: np.ndarray, color: str,
+                      zorder: float):
+    """
+    Build a collection of flecks: small filled circles sized in data units.
+
+    Args:
+        ax: Matplotlib axis the collection will be added to
+        offsets: (N, 2) array of fleck centers
+        radii: Radius of each fleck, in data units
+        color: Fleck color
+        zorder: Z-order for drawing
+
+    Returns:
+        A matplotlib EllipseCollection holding all the flecks
+    """
+    from matplotlib.collections import EllipseCollection
+
+    diameters = 2 * radii
+    return EllipseCollection(
+        diameters, diameters, np.zeros(len(radii)),
+        units='xy',
+        offsets=offsets,
+        offset_transform=ax.transData,
+        facecolors=color,
+        edgecolors='none',
+        alpha=0.8,
+        zorder=zorder
+    )
+
+
+def _ray_collection(segments: np.ndarray, color: str, linewidth: float,
+                    alpha: float, zorder: float):
+    """
+    Build a LineCollection of ray segments styled like individual plotted lines.
+
+    Args:
+        segments: (N, 2, 2) array of ray start and end points
+        color: Ray color
+        linewidth: Line width in points
+        alpha: Opacity of the rays
+        zorder: Z-order for drawing
+
+    Returns:
+        A matplotlib LineCollection holding all the rays
+    """
+    import matplotlib as mpl
+    from matplotlib.collections import LineCollection
+
+    # ax.plot styles solid lines from rcParams; a LineCollection does not,
+    # so pass the cap and join styles along explicitly
+    return LineCollection(
+        segments,
+        colors=color,
+        linewidths=linewidth,
+        alpha=alpha,
+        capstyle=mpl.rcParams['lines.solid_capstyle'],
+        joinstyle=mpl.rcParams['lines.solid_joinstyle'],
+        zorder=zorder
+    )
+
+
+# Unit (cos, sin) directions of the 12 rays around a rayed Sephirah, evenly
+# spaced from angle 0, computed once rather than per rayed element
+_SEPH_RAY_ANGLES = np.arange(12) * (2 * np.pi / 12)
+_SEPH_RAY_DIRS = np.column_stack((np.cos(_SEPH_RAY_ANGLES), np.sin(_SEPH_RAY_ANGLES)))
+_SEPH_RAY_DIRS.flags.writeable = False
+
+# Positions of the 8 ray pairs along a rayed path, as fractions of its length
+_PATH_RAY_T = np.linspace(0.2, 0.8, 8)
+_PATH_RAY_T.flags.writeable = False
 
 
 def apply_color_effect(ax, element_type: str, number: int, x: float, y: float,
@@ -185,100 +354,63 @@ def apply_color_effect(ax, element_type: str, number: int, x: float, y: float,
     if not effect:
         return
 
-    effect_type = effect.get('type')
+    effect_type = effect.kind
 
     if effect_type == 'flecked':
-        # Get the second color for flecking - adapt to YAML structure
-        if 'color2_hex' in effect:
-            color2 = effect['color2_hex']
-        elif 'colors' in effect and len(effect['colors']) > 0:
-            # Use the first color in the colors list if available
-            color2 = effect['colors'][0].get('hex', '#FFFFFF')
-        else:
-            color2 = '#FFFFFF'  # Default
+        # Get the second color for flecking
+        color2 = effect.second_color
 
         if element_type == 'sephirah' and radius:
             # Draw small circles randomly distributed within the Sephirah
             num_flecks = 50  # Number of flecks
-            # Use element number as seed for reproducibility
-            np.random.seed(number)
-
-            for _ in range(num_flecks):
-                # Random position within the circle
-                angle = np.random.uniform(0, 2 * np.pi)
-                # Stay within 90% of radius
-                r = np.random.uniform(0, radius * 0.9)
-                fleck_x = x + r * np.cos(angle)
-                fleck_y = y + r * np.sin(angle)
-
-                # Random size for the fleck, proportional to the main circle
-                fleck_size = np.random.uniform(0.02, 0.05) * radius
-
-                # Draw the fleck
-                fleck = patches.Circle(
-                    (fleck_x, fleck_y),
-                    fleck_size,
-                    facecolor=color2,
-                    edgecolor=None,
-                    alpha=0.8,
-                    zorder=5  # Above the main circle
-                )
-                ax.add_patch(fleck)
+            # Use element number as seed for reproducibility (with a local
+            # generator, so the global NumPy random state is left alone)
+            rng = np.random.default_rng(number)
+
+            # Random position within the circle, staying within 90% of radius
+            angle = rng.uniform(0, 2 * np.pi, num_flecks)
+            r = rng.uniform(0, radius * 0.9, num_flecks)
+            # Random size for each fleck, proportional to the main circle
+            fleck_size = rng.uniform(0.02, 0.05, num_flecks) * radius
+
+            # Draw every fleck in one collection
+            offsets = np.column_stack((x + r * np.cos(angle), y + r * np.sin(angle)))
+            ax.add_collection(_fleck_collection(
+                ax, offsets, fleck_size, color2,
+                zorder=5  # Above the main circle
+            ), autolim=False)
 
         elif element_type == 'path':
             # For paths, this will need to be implemented differently when drawing paths
             pass
 
     elif effect_type == 'rayed':
-        # Get the second color for rays - adapt to YAML structure
-        if 'color2_hex' in effect:
-            color2 = effect['color2_hex']
-        elif 'colors' in effect and len(effect['colors']) > 0:
-            # Use the first color in the colors list if available
-            color2 = effect['colors'][0].get('hex', '#FFFFFF')
-        else:
-            color2 = '#FFFFFF'  # Default
+        # Get the second color for rays
+        color2 = effect.second_color
 
         if element_type == 'sephirah' and radius:
-            # Draw rays emanating from the center
-            num_rays = 12  # Number of rays
+            # Draw rays emanating from the center (see _SEPH_RAY_DIRS)
             ray_length = radius * 1.5  # Rays extend beyond the circle
 
-            for i in range(num_rays):
-                angle = i * (2 * np.pi / num_rays)
-                end_x = x + ray_length * np.cos(angle)
-                end_y = y + ray_length * np.sin(angle)
-
-                # Draw the ray as a line
-                ax.plot(
-                    [x, end_x],
-                    [y, end_y],
-                    color=color2,
-                    linewidth=radius * 0.1,
-                    alpha=0.6,
-                    zorder=2  # Below the main circle but above background
-                )
+            ends = (x, y) + ray_length * _SEPH_RAY_DIRS
+
+            # Draw all rays as one collection of (center, end) segments
+            segments = np.stack((np.broadcast_to((x, y), ends.shape), ends), axis=1)
+            ax.add_collection(_ray_collection(
+                segments, color2, radius * 0.1, alpha=0.6,
+                zorder=2  # Below the main circle but above background
+            ), autolim=False)
 
         elif element_type == 'path':
             # For paths, this will need to be implemented differently when drawing paths
             pass
 
     elif effect_type == 'tinged':
-        # For tinged, we slightly blend the color with another
-        # Get the tinge color - adapt to YAML structure
-        if 'color2_hex' in effect:
-            tinge_color = effect['color2_hex']
-        elif 'colors' in effect and len(effect['colors']) > 0:
-            # Use the first color in the colors list if available
-            tinge_color = effect['colors'][0].get('hex', '#FFFFFF')
-        else:
-            tinge_color = '#FFFFFF'  # Default
-
-        # Blend the colors with a subtle tinge
-        blended_color = blend_colors(color, tinge_color, 0.7)
-
-        # This is typically applied by giving the main color a slight tint
-        # The actual implementation will happen when drawing the elements
+        # For tinged, we slightly blend the color with another (e.g.
+        # blend_colors(color, effect.second_color, 0.7)). This is typically
+        # applied by giving the main color a slight tint, so the actual
+        # implementation will happen when drawing the elements; nothing is
+        # computed here until then
         pass
 
 
@@ -299,17 +431,11 @@ def apply_path_effect(ax, path_num: int, x1: float, y1: float, x2: float, y2: fl
     if not effect:
         return
 
-    effect_type = effect.get('type')
+    effect_type = effect.kind
 
     if effect_type == 'flecked':
-        # Get the second color for flecking - adapt to YAML structure
-        if 'color2_hex' in effect:
-            color2 = effect['color2_hex']
-        elif 'colors' in effect and len(effect['colors']) > 0:
-            # Use the first color in the colors list if available
-            color2 = effect['colors'][0].get('hex', '#FFFFFF')
-        else:
-            color2 = '#FFFFFF'  # Default
+        # Get the second color for flecking
+        color2 = effect.second_color
 
         # Calculate the path length and angle
         dx = x2 - x1
@@ -320,48 +446,34 @@ def apply_path_effect(ax, path_num: int, x1: float, y1: float, x2: float, y2: fl
         # Draw flecks along the path
         # Scale number of flecks with path length
         num_flecks = int(path_length * 15)
-        # Use path number as seed for reproducibility
-        np.random.seed(path_num)
-
-        for _ in range(num_flecks):
-            # Random position along the path
-            t = np.random.uniform(0.1, 0.9)  # Avoid endpoints
-            # Random offset perpendicular to the path
-            offset = np.random.uniform(-0.05, 0.05)
-
-            fleck_x = x1 + t * dx + offset * np.sin(angle)
-            fleck_y = y1 + t * dy - offset * np.cos(angle)
-
-            # Random size for the fleck
-            fleck_size = np.random.uniform(0.01, 0.03) * sphere_scale_factor
-
-            # Draw the fleck
-            fleck = patches.Circle(
-                (fleck_x, fleck_y),
-                fleck_size,
-                facecolor=color2,
-                edgecolor=None,
-                alpha=0.8,
-                zorder=3  # Above the path
-            )
-            ax.add_patch(fleck)
+        # Use path number as seed for reproducibility (with a local
+        # generator, so the global NumPy random state is left alone)
+        rng = np.random.default_rng(path_num)
+
+        # Random positions along the path, avoiding the endpoints
+        t = rng.uniform(0.1, 0.9, num_flecks)
+        # Random offsets perpendicular to the path
+        offset = rng.uniform(-0.05, 0.05, num_flecks)
+        # Random size for each fleck
+        fleck_size = rng.uniform(0.01, 0.03, num_flecks) * sphere_scale_factor
+
+        # Draw every fleck in one collection
+        offsets = np.column_stack((x1 + t * dx + offset * np.sin(angle),
+                                   y1 + t * dy - offset * np.cos(angle)))
+        ax.add_collection(_fleck_collection(
+            ax, offsets, fleck_size, color2,
+            zorder=3  # Above the path
+        ), autolim=False)
 
     elif effect_type == 'rayed':
-        # Get the second color for rays - adapt to YAML structure
-        if 'color2_hex' in effect:
-            color2 = effect['color2_hex']
-        elif 'colors' in effect and len(effect['colors']) > 0:
-            # Use the first color in the colors list if available
-            color2 = effect['colors'][0].get('hex', '#FFFFFF')
-        else:
-            color2 = '#FFFFFF'  # Default
+        # Get the second color for rays
+        color2 = effect.second_color
 
         # Calculate the midpoint
         mid_x = (x1 + x2) / 2
         mid_y = (y1 + y2) / 2
 
-        # Draw rays emanating perpendicular to the path
-        num_rays = 8  # Number of rays
+        # Draw rays emanating perpendicular to the path (see _PATH_RAY_T)
         ray_length = 0.2 * sphere_scale_factor  # Length of rays
 
         # Calculate path direction vector
@@ -378,47 +490,30 @@ def apply_path_effect(ax, path_num: int, x1: float, y1: float, x2: float, y2: fl
             perp_dx = -dy
             perp_dy = dx
 
-            # Draw rays along the path
-            for t in np.linspace(0.2, 0.8, num_rays):
-                # Position along the path
-                ray_x = x1 + t * dx * path_length
-                ray_y = y1 + t * dy * path_length
-
-                # Draw rays in perpendicular directions
-                ax.plot(
-                    [ray_x, ray_x + perp_dx * ray_length],
-                    [ray_y, ray_y + perp_dy * ray_length],
-                    color=color2,
-                    linewidth=1.5,
-                    alpha=0.7,
-                    zorder=2.5
-                )
-
-                ax.plot(
-                    [ray_x, ray_x - perp_dx * ray_length],
-                    [ray_y, ray_y - perp_dy * ray_length],
-                    color=color2,
-                    linewidth=1.5,
-                    alpha=0.7,
-                    zorder=2.5
-                )
+            # Positions of the rays along the path
+            t = _PATH_RAY_T
+            starts = np.column_stack((x1 + t * dx * path_length,
+                                      y1 + t * dy * path_length))
+            perp = np.array([perp_dx, perp_dy]) * ray_length
+
+            # Draw rays in both perpendicular directions, as one collection
+            # ordered like the pairs of lines they replace
+            segments = np.empty((len(t), 2, 2, 2))
+            segments[:, :, 0] = starts[:, None]
+            segments[:, 0, 1] = starts + perp
+            segments[:, 1, 1] = starts - perp
+            ax.add_collection(_ray_collection(
+                segments.reshape(-1, 2, 2), color2, 1.5, alpha=0.7, zorder=2.5
+            ), autolim=False)
 
     elif effect_type == 'tinged':
-        # For tinged paths, we'd normally blend the colors
-        # Get the tinge color - adapt to YAML structure
-        if 'color2_hex' in effect:
-            tinge_color = effect['color2_hex']
-        elif 'colors' in effect and len(effect['colors']) > 0:
-            # Use the first color in the colors list if available
-            tinge_color = effect['colors'][0].get('hex', '#FFFFFF')
-        else:
-            tinge_color = '#FFFFFF'  # Default
-
-        # The blended color would be used to draw the path
-        # This is handled during the main path drawing
+        # For tinged paths, we'd normally blend the colors with
+        # effect.second_color; the blended color would be used to draw the
+        # path, so this is handled during the main path drawing
         pass
 
 
+@lru_cache(maxsize=512)
 def get_contrasting_text_color(background_color: str) -> str:
     """
     Determine whether to use light or dark text based on background color brightness.